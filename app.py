@@ -1,11 +1,34 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
-import matplotlib.pyplot as plt
 from news_scraper import get_news
-from news_sentiment import comparative_analysis, text_to_speech
-from yahoo_fin import stock_info
-import os
+from news_sentiment import comparative_analysis, synthesize_narration
+from narration import build_narration_segments
+from audio_utils import detect_format, mime_type
+from audio_playlist import get_playlist
+from ticker_index import get_ticker_index, short_name
+from stock_loader import load_stock_data
+from financials import get_financials_service
+from event_study import articles_frame, event_study
+from charts import chart_data, get_chart_cache
+from intraday import POLL_SECONDS as INTRADAY_REFRESH_SECONDS, get_intraday_feed
+from indicators import DEFAULT_INDICATORS, PRICE_OVERLAYS, get_indicator_cache
+
+# ✅ Audio formats offered in the speech section
+AUDIO_FORMATS = {"MP3": "mp3", "Opus (smallest)": "ogg", "WAV": "wav"}
+
+# ✅ Intraday price line: only this fragment reruns on the timer, so the chart updates in place
+@st.fragment(run_every=INTRADAY_REFRESH_SECONDS)
+def intraday_chart(ticker):
+    try:
+        bars = get_intraday_feed().bars(ticker)
+    except Exception as e:
+        st.warning(f"⚠️ Unable to fetch intraday prices. Reason: {str(e)}")
+        return
+    if bars.empty:
+        st.info("ℹ️ No intraday bars yet (the market may be closed).")
+        return
+    st.write(f"**Last ({bars.index[-1]:%H:%M} UTC):** ${bars['Close'].iloc[-1]:,.2f}")
+    st.line_chart(chart_data(bars[["Close"]].rename(columns={"Close": ticker})), x="Date", y="Value", color="Series", height=220)
 
 # ✅ Set page configuration
 st.set_page_config(page_title="News & Stock Sentiment Analysis", layout="wide")
@@ -16,18 +39,18 @@ st.markdown("<h1 style='text-align: center; color: #ff4b4b;'>📊 AI-Powered New
 # ✅ User input for company name
 company_name = st.text_input("🔍 Enter a Company Name (e.g., Tesla, Apple):", value="Tesla")
 
+# ✅ Autocomplete from the local symbol table (no network round-trip)
+suggestions = get_ticker_index().complete(company_name)
+if suggestions and company_name.strip().lower() not in {short_name(entry).lower() for entry in suggestions}:
+    labels = {f"{entry['name']} ({entry['ticker']}, {entry['exchange']})": entry for entry in suggestions}
+    choice = st.selectbox("💡 Matching companies:", ["Use what I typed"] + list(labels))
+    if choice in labels:
+        company_name = short_name(labels[choice])
+
 if st.button("Analyze News"):
     st.session_state["analysis_done"] = True
     st.session_state["company_name"] = company_name
 
-# ✅ Function to get stock ticker from company name
-def get_stock_ticker(company_name):
-    try:
-        ticker = stock_info.get_quote_table(company_name, dict_result=False).iloc[0]["Symbol"]
-        return ticker
-    except Exception:
-        return None
-
 # ✅ Show results only if analysis has been performed
 if st.session_state.get("analysis_done"):
     st.write(f"📡 Fetching and analyzing news for: **{st.session_state['company_name']}**")
@@ -54,74 +77,145 @@ if st.session_state.get("analysis_done"):
                 st.write(f"- **{comparison['Comparison']}**")
                 st.write(f"  🔹 **Impact:** {comparison['Impact']}")
 
+        if sentiment_report.get("Topic Coverage"):
+            st.write("🗂️ **Topic Coverage:**")
+            for topic in sentiment_report["Topic Coverage"]:
+                st.write(f"- **{topic['Topic']}** ({topic['Articles']} articles) — {topic['Sentiment Distribution']}")
+
         # ✅ Audio Download & Playback (Restored!)
         st.subheader("🎙️ Generate Speech")
-        lang_option = st.radio("Choose language:", ["English", "Hindi"])
+        lang_option = st.radio("Choose language:", ["English", "Hindi"], key="lang_option")
         lang_code = "en" if lang_option == "English" else "hi"
+        format_option = st.radio("Audio format:", list(AUDIO_FORMATS), horizontal=True, key="format_option")
+        audio_format = AUDIO_FORMATS[format_option]
+
+        # ✅ Per-article playlist (rendered in the background; ready items play instantly)
+        playlist = get_playlist(st.session_state["company_name"], lang_code, audio_format)
+        playlist.add_articles(news_data)
+        with st.expander(f"🎧 Headline Playlist ({playlist.pending()} still rendering)"):
+            for item in playlist.items():
+                st.write(f"🔹 {item['title']}")
+                if item["audio"]:
+                    st.audio(item["audio"], format=mime_type(item["audio"]))
+                elif item["error"]:
+                    st.caption(f"⚠️ Audio unavailable: {item['error']}")
+                else:
+                    st.caption("⏳ Rendering…")
+            if playlist.pending():
+                st.button("🔄 Refresh playlist")
 
         if st.button("Generate & Download Speech"):
-            speech_file = text_to_speech(str(sentiment_report), lang=lang_code)
-            if os.path.exists(speech_file):
-                st.audio(speech_file, format="audio/mp3")  # ✅ Audio Player is now visible
-                st.download_button("⬇ Download Speech", open(speech_file, "rb"), file_name=speech_file)
-
-        # ✅ Auto-Detect Stock Ticker
-        stock_ticker = get_stock_ticker(st.session_state["company_name"])
+            # ✅ Speak a short briefing instead of the raw report (template phrases are reused across briefings)
+            narration = build_narration_segments(
+                st.session_state["company_name"], news_data, sentiment_report.get("Sentiment Distribution"), lang=lang_code
+            )
+            try:
+                # ✅ Player and download share one in-memory buffer (no temp files)
+                audio = synthesize_narration(narration, lang=lang_code, fmt=audio_format)
+                st.audio(audio, format=mime_type(audio))  # ✅ Audio Player is now visible
+                file_name = f"speech_{st.session_state['company_name']}_{lang_code}.{detect_format(audio)}"
+                st.download_button("⬇ Download Speech", audio, file_name=file_name, mime=mime_type(audio))
+            except Exception as e:
+                st.error(f"❌ Error in TTS conversion. Reason: {str(e)}")
 
-        # ✅ Stock Data & Financial Statistics
+        # ✅ Stock Data & Financial Statistics (ticker, quote, financials and history fetched concurrently)
         st.subheader("📈 Company Financial Data")
-        if stock_ticker:
-            try:
-                stock_symbol = yf.Ticker(stock_ticker)
-                stock_info = stock_symbol.info
-
-                # ✅ Check if stock_info is available
-                if stock_info and "regularMarketPrice" in stock_info:
-                    st.write(f"**Stock Price ({stock_ticker}):** ${stock_info.get('regularMarketPrice', 'N/A')}")
-                    st.write(f"**Market Cap:** ${stock_info.get('marketCap', 'N/A')}")
-                    
-                    # ✅ Fetch financial data (if available)
-                    st.subheader("📊 Financial Statistics")
+        show_financials = st.checkbox("Show financial statistics", value=True)
+        price_range = st.radio("Price range:", ["1mo", "3mo", "6mo", "1y", "ytd", "5y"], index=2, horizontal=True)
+        stock = load_stock_data(
+            st.session_state["company_name"], mode="full" if show_financials else "quote", period=price_range
+        )
+
+        if stock.available:
+            if stock.price is not None:
+                st.write(f"**Stock Price ({stock.ticker}):** ${stock.price:,.2f}")
+                st.write(f"**Market Cap:** ${stock.market_cap:,.0f}" if stock.market_cap else "**Market Cap:** N/A")
+            else:
+                st.warning(f"⚠️ No stock data available. Reason: {stock.errors.get('quote', 'unknown')}")
+
+            # ✅ Intraday mode: one-minute bars polled incrementally into a per-ticker ring buffer
+            if st.toggle("⏱️ Live intraday prices"):
+                intraday_chart(stock.ticker)
+
+            # ✅ Financial data (if available)
+            if show_financials:
+                st.subheader("📊 Financial Statistics")
+                statements = stock.financials
+                if statements is not None and not statements.empty:
+                    # ✅ Income statement, balance sheet and cash flow (cached until the next report is due)
+                    for tab, statement in zip(st.tabs(["Income Statement", "Balance Sheet", "Cash Flow"]), ["income", "balance", "cashflow"]):
+                        with tab:
+                            st.dataframe(statements.frame(statement))
+                    financials = statements.frame("income")
+                    # ✅ Plot Revenue & Net Income (if available), drawn client-side
+                    if "Total Revenue" in financials.index and "Net Income" in financials.index:
+                        st.line_chart(
+                            financials.loc[["Total Revenue", "Net Income"]].T,
+                            x_label="Year", y_label="USD ($)", color=["#008000", "#ff0000"],
+                        )
+
+                    # ✅ Key ratios against a peer group (latest reported period)
+                    ratio_peers = st.text_input("Compare ratios with (tickers, comma-separated):", "")
+                    peer_tickers = [stock.ticker] + [peer.strip().upper() for peer in ratio_peers.split(",") if peer.strip()]
                     try:
-                        financials = stock_symbol.financials
-                        if financials is not None and not financials.empty:
-                            st.write(financials)
-                            # ✅ Plot Revenue & Net Income (if available)
-                            if "Total Revenue" in financials.index and "Net Income" in financials.index:
-                                fig, ax = plt.subplots(figsize=(8, 4))
-                                ax.plot(financials.columns, financials.loc["Total Revenue"], label="Total Revenue", color="green")
-                                ax.plot(financials.columns, financials.loc["Net Income"], label="Net Income", color="red")
-                                ax.set_xlabel("Year")
-                                ax.set_ylabel("USD ($)")
-                                ax.legend()
-                                st.pyplot(fig)
-                        else:
-                            st.warning("⚠️ No financial data available.")
-                    except Exception:
-                        st.warning("⚠️ Unable to fetch financial statistics.")
-
+                        st.dataframe(get_financials_service().peer_ratios(peer_tickers).style.format("{:.2f}", na_rep="N/A"))
+                    except Exception as e:
+                        st.warning(f"⚠️ Unable to compute financial ratios. Reason: {str(e)}")
+                elif "financials" in stock.errors:
+                    st.warning(f"⚠️ Unable to fetch financial statistics. Reason: {stock.errors['financials']}")
                 else:
-                    st.warning("⚠️ No stock data available.")
+                    st.warning("⚠️ No financial data available.")
 
-            except Exception as e:
-                st.error(f"❌ Could not fetch stock data. Reason: {str(e)}")
-
-            # ✅ Stock Price Chart
+            # ✅ Stock Price Chart (served from the local bar store; only new bars are downloaded)
             st.subheader("📊 Stock Price Trend")
+            stock_data = stock.history
+            if stock_data is not None and not stock_data.empty:
+                selected = st.multiselect("Indicators:", list(DEFAULT_INDICATORS), default=["SMA 20", "SMA 50"])
+                peers = st.text_input("Compare indicators with (tickers, comma-separated):", "")
+                tickers = [stock.ticker] + [peer.strip().upper() for peer in peers.split(",") if peer.strip()]
+
+                # ✅ Indicators for all tickers in one vectorized pass, cached until a new bar arrives
+                try:
+                    panel = get_indicator_cache().panel(tickers, period=price_range)
+                except Exception as e:
+                    panel = {}
+                    st.warning(f"⚠️ Unable to compute indicators. Reason: {str(e)}")
+                overlays = [name for name in selected if DEFAULT_INDICATORS[name][0] in PRICE_OVERLAYS]
+                panels = [name for name in selected if DEFAULT_INDICATORS[name][0] not in PRICE_OVERLAYS and name in panel]
+
+                # ✅ Client-side charts: LTTB-downsampled to the chart width, payload cached per (ticker, range, last bar)
+                def build_charts():
+                    price = pd.DataFrame({"Stock Price": stock_data["Close"]})
+                    for name in overlays:
+                        if name in panel and stock.ticker in panel[name]:
+                            price[name] = panel[name][stock.ticker]
+                    return {"Price (USD)": chart_data(price), **{name: chart_data(panel[name]) for name in panels}}
+
+                chart_key = (stock.ticker, price_range, stock_data.index[-1], float(stock_data["Close"].iloc[-1]), tuple(selected), tuple(tickers))
+                for label, data in get_chart_cache().get_or_build(chart_key, build_charts).items():
+                    if label != "Price (USD)":
+                        st.caption(label)
+                    st.line_chart(data, x="Date", y="Value", color="Series", y_label=label, height=320 if label == "Price (USD)" else 180)
+            elif "history" in stock.errors:
+                st.error(f"❌ Error fetching stock chart. Reason: {stock.errors['history']}")
+            else:
+                st.warning("⚠️ No stock price data available.")
+
+            # ✅ Sentiment vs Price: returns after each article (as-of the last close before publication)
+            st.subheader("📐 Price Moves After the News")
             try:
-                stock_data = stock_symbol.history(period="6mo")
-                if not stock_data.empty:
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.plot(stock_data.index, stock_data["Close"], label="Stock Price", color="blue")
-                    ax.set_xlabel("Date")
-                    ax.set_ylabel("Price (USD)")
-                    ax.legend()
-                    st.pyplot(fig)
+                _, event_summary = event_study(articles_frame(news_data, stock.ticker))
+                if not event_summary.empty:
+                    st.dataframe(
+                        event_summary.pivot(index="sentiment", columns="horizon", values="mean")
+                        .rename(columns=lambda horizon: f"{horizon}d return")
+                        .style.format("{:+.2%}")
+                    )
+                    st.caption("Mean forward return by article sentiment; recent articles may not have a full horizon yet.")
                 else:
-                    st.warning("⚠️ No stock price data available.")
-
+                    st.info("ℹ️ Not enough price history after these articles yet.")
             except Exception as e:
-                st.error(f"❌ Error fetching stock chart. Reason: {str(e)}")
+                st.warning(f"⚠️ Unable to compare sentiment with prices. Reason: {str(e)}")
 
         else:
             st.warning("⚠️ Data Not Available.")
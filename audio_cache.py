@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+# ✅ Cache location and size bound (override via environment)
+AUDIO_CACHE_DIR = os.environ.get("AUDIO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "news_tts_cache"))
+AUDIO_CACHE_MAX_BYTES = int(os.environ.get("AUDIO_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+def cache_key(text, lang, engine, voice=None, rate=None, fmt="mp3"):
+    """Returns a content hash identifying one synthesis request."""
+    payload = json.dumps([text, lang, engine, voice, rate, fmt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class AudioCache:
+    """Content-addressed disk cache for synthesized audio.
+
+    Files live in two levels of sharded directories (`ab/cd/<key>.<fmt>`), are written
+    atomically (temp file + rename), and the least recently used files are evicted once
+    the cache grows beyond `max_bytes`. A hit refreshes the file's mtime, which is what
+    eviction orders by.
+    """
+
+    def __init__(self, root=AUDIO_CACHE_DIR, max_bytes=AUDIO_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None  # Bytes on disk, computed lazily on first write
+
+    def path(self, key, fmt="mp3"):
+        return os.path.join(self.root, key[:2], key[2:4], f"{key}.{fmt}")
+
+    def get(self, key, fmt="mp3"):
+        """Returns the cached audio bytes, or None on a miss."""
+        path = self.path(key, fmt)
+        try:
+            with open(path, "rb") as audio_file:
+                data = audio_file.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, key, data, fmt="mp3"):
+        """Stores audio bytes under `key` and returns the cached file path."""
+        path = self.path(key, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)  # ✅ Readers never see a partially written file
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+        return path
+
+    def _entries(self):
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _disk_usage(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Deletes least recently used files until the cache is back to 90% of its bound."""
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+    def get_or_create(self, key, synthesize, fmt="mp3"):
+        """Returns cached audio for `key`, calling `synthesize()` (which returns bytes) on a miss."""
+        data = self.get(key, fmt)
+        if data is None:
+            data = synthesize()
+            self.put(key, data, fmt)
+        return data
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_audio_cache():
+    """Returns the process-wide audio cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AudioCache()
+        return _cache
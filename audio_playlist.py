@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from audio_cache import cache_key, get_audio_cache
+from audio_utils import DEFAULT_FORMAT, transcode
+from narration import as_sentence
+from script_router import synthesize_mixed
+
+PLAYLIST_MAX_WORKERS = 2  # Background synthesis threads shared by all playlists
+MAX_PLAYLISTS = 32
+
+_executor = ThreadPoolExecutor(max_workers=PLAYLIST_MAX_WORKERS, thread_name_prefix="playlist")
+
+def article_script(article):
+    """Returns what is read out for one article: its headline, then its summary when there is one."""
+    parts = [as_sentence(article["title"])]
+    summary = article.get("summary") or ""
+    if summary and summary != "No summary available.":
+        parts.append(as_sentence(summary))
+    return " ".join(parts)
+
+def render_article(article, lang="en", fmt=DEFAULT_FORMAT):
+    """Returns one article's audio, cached per article text, language and format."""
+    text = article_script(article)
+    key = cache_key(text, lang, "playlist", fmt=fmt)
+    return get_audio_cache().get_or_create(key, lambda: transcode(synthesize_mixed(text, lang), fmt), fmt=fmt)
+
+class AudioPlaylist:
+    """Ordered per-article audio, synthesized in the background as articles arrive.
+
+    `add_articles` only queues articles not already in the playlist, so new fetches cost
+    just their own synthesis; `items()` reports what is ready to play right now.
+    """
+
+    def __init__(self, lang="en", fmt=DEFAULT_FORMAT):
+        self.lang = lang
+        self.fmt = fmt
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_articles(self, articles):
+        """Appends unseen articles (by link, else title) and starts rendering them; returns how many were new."""
+        added = 0
+        for article in articles if isinstance(articles, list) else []:
+            key = article.get("link") or article.get("title")
+            if not key or not article.get("title"):
+                continue
+            with self._lock:
+                if key in self._entries:
+                    continue
+                self._entries[key] = {
+                    "title": article["title"],
+                    "link": article.get("link"),
+                    "future": _executor.submit(render_article, article, self.lang, self.fmt),
+                }
+            added += 1
+        return added
+
+    def items(self):
+        """Returns the playlist in order: title, link, and audio bytes once ready (else None) or an error."""
+        with self._lock:
+            entries = list(self._entries.values())
+
+        playlist = []
+        for entry in entries:
+            future = entry["future"]
+            item = {"title": entry["title"], "link": entry["link"], "audio": None, "error": None}
+            if future.done():
+                if future.exception() is not None:
+                    item["error"] = str(future.exception())
+                else:
+                    item["audio"] = future.result()
+            playlist.append(item)
+        return playlist
+
+    def pending(self):
+        with self._lock:
+            return sum(not entry["future"].done() for entry in self._entries.values())
+
+_playlists = OrderedDict()
+_playlists_lock = threading.Lock()
+
+def get_playlist(company, lang="en", fmt=DEFAULT_FORMAT):
+    """Returns the shared playlist for (company, language, format), keeping the most recent MAX_PLAYLISTS."""
+    key = (company.strip().lower(), lang, fmt)
+    with _playlists_lock:
+        playlist = _playlists.get(key)
+        if playlist is None:
+            playlist = _playlists[key] = AudioPlaylist(lang=lang, fmt=fmt)
+        _playlists.move_to_end(key)
+        while len(_playlists) > MAX_PLAYLISTS:
+            _playlists.popitem(last=False)
+        return playlist
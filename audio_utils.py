@@ -0,0 +1,126 @@
+import wave
+from io import BytesIO
+from math import gcd
+import lameenc
+import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+
+# ✅ Output formats: MP3 (lame), Opus in Ogg, or uncompressed WAV
+OUTPUT_FORMATS = ("mp3", "ogg", "wav")
+DEFAULT_FORMAT = "mp3"
+DEFAULT_BITRATE_KBPS = {"mp3": 64, "ogg": 32}  # Plenty for a single speaking voice
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+OPUS_MAX_KBPS, OPUS_MIN_KBPS = 256, 6  # libsndfile maps compression level 0..1 linearly onto this range
+
+MIME_TYPES = {
+    "mp3": "audio/mp3",
+    "wav": "audio/wav",
+    "ogg": "audio/ogg",
+}
+
+def detect_format(audio):
+    """Identifies audio bytes as "wav", "ogg" or "mp3" from their leading magic bytes."""
+    header = bytes(audio[:4])
+    if header == b"RIFF":
+        return "wav"
+    if header == b"OggS":
+        return "ogg"
+    return "mp3"  # ID3 tag or a bare MPEG frame sync
+
+def mime_type(audio):
+    """Returns the MIME type to hand to `st.audio` for the given bytes."""
+    return MIME_TYPES[detect_format(audio)]
+
+def concat_audio(parts):
+    """Concatenates audio clips of one format in order (WAV frames are merged under a single header)."""
+    parts = [part for part in parts if part]
+    if not parts:
+        return b""
+    if detect_format(parts[0]) != "wav":
+        return b"".join(parts)  # MP3 frames and Ogg pages can be chained as-is
+
+    output = BytesIO()
+    with wave.open(output, "wb") as combined:
+        for index, part in enumerate(parts):
+            with wave.open(BytesIO(part), "rb") as clip:
+                if index == 0:
+                    combined.setparams(clip.getparams())
+                combined.writeframes(clip.readframes(clip.getnframes()))
+    return output.getvalue()
+
+def decode_audio(audio):
+    """Decodes WAV, MP3 or Ogg bytes into mono float32 samples and their sample rate."""
+    samples, samplerate = sf.read(BytesIO(audio), dtype="float32", always_2d=True)
+    return samples.mean(axis=1), samplerate
+
+def _mp3_encoder(samplerate, bitrate_kbps):
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(bitrate_kbps)
+    encoder.set_in_sample_rate(samplerate)
+    encoder.set_channels(1)
+    encoder.set_quality(5)
+    return encoder
+
+def _pcm16(samples):
+    return (np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes()
+
+def _encode_mp3(samples, samplerate, bitrate_kbps):
+    encoder = _mp3_encoder(samplerate, bitrate_kbps)
+    return bytes(encoder.encode(_pcm16(samples)) + encoder.flush())
+
+def _encode_opus(samples, samplerate, bitrate_kbps):
+    # Opus only accepts a few rates; resample to the nearest one at or above the source rate
+    target = next((rate for rate in OPUS_SAMPLE_RATES if rate >= samplerate), OPUS_SAMPLE_RATES[-1])
+    if target != samplerate:
+        common = gcd(target, samplerate)
+        samples = resample_poly(samples, target // common, samplerate // common).astype("float32")
+    level = (OPUS_MAX_KBPS - min(max(bitrate_kbps, OPUS_MIN_KBPS), OPUS_MAX_KBPS)) / (OPUS_MAX_KBPS - OPUS_MIN_KBPS)
+    output = BytesIO()
+    sf.write(output, samples, target, format="OGG", subtype="OPUS", compression_level=level)
+    return output.getvalue()
+
+def _encode_wav(samples, samplerate):
+    output = BytesIO()
+    sf.write(output, samples, samplerate, format="WAV", subtype="PCM_16")
+    return output.getvalue()
+
+def transcode(audio, fmt=DEFAULT_FORMAT, bitrate_kbps=None):
+    """Re-encodes audio bytes in-process into `fmt` ("mp3", "ogg" for Opus, or "wav") at `bitrate_kbps`.
+
+    Audio that is already in the requested format is returned untouched unless a bitrate is given.
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported audio format '{fmt}' (expected one of {', '.join(OUTPUT_FORMATS)})")
+    if not audio or (detect_format(audio) == fmt and bitrate_kbps is None):
+        return audio
+
+    samples, samplerate = decode_audio(audio)
+    bitrate_kbps = bitrate_kbps or DEFAULT_BITRATE_KBPS.get(fmt)
+    if fmt == "mp3":
+        return _encode_mp3(samples, samplerate, bitrate_kbps)
+    if fmt == "ogg":
+        return _encode_opus(samples, samplerate, bitrate_kbps)
+    return _encode_wav(samples, samplerate)
+
+def transcode_stream(chunks, fmt=DEFAULT_FORMAT, bitrate_kbps=None):
+    """Transcodes a stream of audio chunks as they arrive.
+
+    MP3 output comes from one running encoder, so the yielded bytes form a single gapless
+    stream; Opus and WAV chunks are encoded one by one (chained Ogg streams / separate clips).
+    """
+    if fmt != "mp3":
+        for chunk in chunks:
+            yield transcode(chunk, fmt, bitrate_kbps)
+        return
+
+    encoder = None
+    for chunk in chunks:
+        samples, samplerate = decode_audio(chunk)
+        if encoder is None:
+            encoder = _mp3_encoder(samplerate, bitrate_kbps or DEFAULT_BITRATE_KBPS["mp3"])
+        data = encoder.encode(_pcm16(samples))
+        if data:
+            yield bytes(data)
+    if encoder is not None:
+        yield bytes(encoder.flush())
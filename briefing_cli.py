@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from news_scraper import get_news
+from news_sentiment import comparative_analysis, synthesize_narration
+from narration import NARRATION_MAX_CHARS, build_narration_segments
+from audio_utils import DEFAULT_FORMAT, OUTPUT_FORMATS
+
+MANIFEST_NAME = "manifest.json"
+
+def slugify(company):
+    return re.sub(r"[^a-z0-9]+", "-", company.lower()).strip("-") or "company"
+
+def load_watchlist(path):
+    """Reads one company per line, ignoring blank lines and `#` comments."""
+    with open(path, encoding="utf-8") as watchlist:
+        return [line.split("#", 1)[0].strip() for line in watchlist if line.split("#", 1)[0].strip()]
+
+class BriefingBatch:
+    """Fetches, analyzes and synthesizes briefings for many companies as a three-stage pipeline.
+
+    Each stage has its own pool (network fetch, CPU scoring, TTS), so a slow stage never
+    starves the others. Finished companies are checkpointed in `manifest.json` after every
+    step, and a rerun skips the ones whose audio already exists in the same language and format.
+    """
+
+    def __init__(self, out_dir, lang="en", fmt=DEFAULT_FORMAT, bitrate_kbps=None, num_articles=10,
+                 max_chars=NARRATION_MAX_CHARS, fetch_workers=8, score_workers=4, tts_workers=2):
+        self.out_dir = out_dir
+        self.lang = lang
+        self.fmt = fmt
+        self.bitrate_kbps = bitrate_kbps
+        self.num_articles = num_articles
+        self.max_chars = max_chars
+        self.pools = {
+            "fetch": ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="fetch"),
+            "score": ThreadPoolExecutor(max_workers=score_workers, thread_name_prefix="score"),
+            "tts": ThreadPoolExecutor(max_workers=tts_workers, thread_name_prefix="tts"),
+        }
+        self.manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+        self._lock = threading.Lock()
+        self._done = threading.Semaphore(0)
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {"companies": {}}
+
+    def _save_manifest(self):
+        # ✅ Atomic replace: a crash mid-write never corrupts the checkpoint
+        fd, tmp_path = tempfile.mkstemp(dir=self.out_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(self.manifest, tmp_file, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def entry_key(self, company):
+        """Checkpoint key: one entry per (company, language, format), so other outputs are never mistaken as done."""
+        return f"{company}|{self.lang}|{self.fmt}"
+
+    def entry(self, company):
+        return self.manifest["companies"].get(self.entry_key(company), {})
+
+    def _record(self, company, **fields):
+        with self._lock:
+            entry = self.manifest["companies"].setdefault(
+                self.entry_key(company), {"company": company, "lang": self.lang, "format": self.fmt, "timings": {}}
+            )
+            timings = fields.pop("timings", {})
+            entry.update(fields)
+            entry["timings"].update(timings)
+            self._save_manifest()
+
+    def is_done(self, company):
+        entry = self.entry(company)
+        return entry.get("status") == "ok" and os.path.exists(entry.get("output", ""))
+
+    def run(self, companies):
+        """Runs the pipeline for every company not already finished; returns the manifest."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        todo = [company for company in dict.fromkeys(companies) if not self.is_done(company)]
+        self.manifest["started"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        for company in todo:
+            self._record(company, status="queued", error=None)
+            self.pools["fetch"].submit(self._fetch, company, time.monotonic())
+        for _ in todo:
+            self._done.acquire()
+        for pool in self.pools.values():
+            pool.shutdown()
+        self.manifest["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self._save_manifest()
+        return self.manifest
+
+    def _fail(self, company, stage, error):
+        try:
+            self._record(company, status="failed", error=f"{stage}: {error}")
+        finally:
+            self._done.release()  # Even if the checkpoint can't be written, run() must not wait forever
+
+    def _fetch(self, company, started):
+        try:
+            step = time.monotonic()
+            news_data = get_news(company, num_articles=self.num_articles)
+            if "error" in news_data:
+                raise RuntimeError(news_data["error"])
+            self._record(company, status="fetched", articles=len(news_data), timings={"fetch": round(time.monotonic() - step, 3)})
+            self.pools["score"].submit(self._score, company, news_data, started)
+        except Exception as e:
+            self._fail(company, "fetch", e)
+
+    def _score(self, company, news_data, started):
+        try:
+            step = time.monotonic()
+            report = comparative_analysis(news_data)
+            distribution = report.get("Sentiment Distribution")
+            segments = build_narration_segments(company, news_data, distribution, lang=self.lang, max_chars=self.max_chars)
+            self._record(
+                company, status="scored", sentiment=distribution, timings={"score": round(time.monotonic() - step, 3)}
+            )
+            self.pools["tts"].submit(self._synthesize, company, segments, started)
+        except Exception as e:
+            self._fail(company, "score", e)
+
+    def _synthesize(self, company, segments, started):
+        try:
+            step = time.monotonic()
+            audio = synthesize_narration(segments, lang=self.lang, fmt=self.fmt, bitrate_kbps=self.bitrate_kbps)
+            output = os.path.join(self.out_dir, f"{slugify(company)}_{self.lang}.{self.fmt}")
+            with open(output, "wb") as audio_file:
+                audio_file.write(audio)
+            now = time.monotonic()
+            self._record(
+                company,
+                status="ok",
+                output=output,
+                bytes=len(audio),
+                script=" ".join(text for text, _ in segments),
+                timings={"tts": round(now - step, 3), "total": round(now - started, 3)},
+            )
+        except Exception as e:
+            self._record(company, status="failed", error=f"tts: {e}")
+        finally:
+            self._done.release()  # Last stage: every company releases exactly once, whatever fails
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate audio news briefings for a watchlist of companies.")
+    parser.add_argument("companies", nargs="*", help="Company names (in addition to --watchlist)")
+    parser.add_argument("--watchlist", help="File with one company per line")
+    parser.add_argument("--out-dir", default="briefings", help="Output directory (also holds manifest.json)")
+    parser.add_argument("--lang", choices=["en", "hi"], default="en")
+    parser.add_argument("--format", dest="fmt", choices=OUTPUT_FORMATS, default=DEFAULT_FORMAT)
+    parser.add_argument("--bitrate", type=int, help="Target bitrate in kbps (mp3/ogg)")
+    parser.add_argument("--num-articles", type=int, default=10)
+    parser.add_argument("--max-chars", type=int, default=NARRATION_MAX_CHARS, help="Narration length budget")
+    parser.add_argument("--fetch-workers", type=int, default=8, help="Concurrent NewsAPI requests")
+    parser.add_argument("--score-workers", type=int, default=4, help="Concurrent analysis jobs")
+    parser.add_argument("--tts-workers", type=int, default=2, help="Concurrent synthesis jobs")
+    args = parser.parse_args(argv)
+
+    companies = list(args.companies)
+    if args.watchlist:
+        companies += load_watchlist(args.watchlist)
+    if not companies:
+        parser.error("no companies given (pass names or --watchlist)")
+
+    batch = BriefingBatch(
+        args.out_dir,
+        lang=args.lang,
+        fmt=args.fmt,
+        bitrate_kbps=args.bitrate,
+        num_articles=args.num_articles,
+        max_chars=args.max_chars,
+        fetch_workers=args.fetch_workers,
+        score_workers=args.score_workers,
+        tts_workers=args.tts_workers,
+    )
+    skipped = sum(batch.is_done(company) for company in companies)
+    batch.run(companies)
+
+    companies = list(dict.fromkeys(companies))
+    failed = [company for company in companies if batch.entry(company).get("status") != "ok"]
+    print(f"✅ {len(companies) - len(failed)} briefings ready ({skipped} resumed from checkpoint) in {args.out_dir}")
+    for company in failed:
+        print(f"❌ {company}: {batch.entry(company).get('error')}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+CHART_POINTS = 800  # Roughly the chart width in pixels; more points than this are invisible
+MAX_CACHED_CHARTS = 128
+
+def lttb(x, y, threshold=CHART_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling; returns the indices of the points to keep.
+
+    Keeps the first and last points, and from each of `threshold - 2` equal buckets the
+    point forming the largest triangle with the previously kept point and the next
+    bucket's average, which preserves peaks and troughs that plain striding drops.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)  # Bucket boundaries for the middle points
+    kept = np.empty(threshold, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        following = slice(stop, edges[bucket + 2] if bucket + 2 < len(edges) else n)
+        next_x, next_y = x[following].mean(), y[following].mean()
+        # Twice the triangle area for every candidate in the bucket at once
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous]) - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        kept[bucket + 1] = previous
+    return kept
+
+def downsample(series, threshold=CHART_POINTS):
+    """LTTB-downsamples one Series (datetime or numeric index), ignoring missing values."""
+    series = series.dropna()
+    if len(series) <= threshold:
+        return series
+    index = series.index
+    x = index.asi8 if isinstance(index, pd.DatetimeIndex) else np.asarray(index, dtype="float64")
+    return series.iloc[lttb(x, series.to_numpy(), threshold)]
+
+def chart_data(frame, threshold=CHART_POINTS, x="Date", value="Value", series="Series"):
+    """Turns a wide frame (one column per line) into a downsampled long frame for `st.line_chart`.
+
+    Each column is downsampled on its own, so lines with gaps (or different histories)
+    keep their own shape; pass the result as `st.line_chart(data, x=x, y=value, color=series)`.
+    """
+    parts = []
+    for column in frame.columns:
+        points = downsample(frame[column], threshold)
+        parts.append(pd.DataFrame({x: points.index, value: points.to_numpy(dtype="float64"), series: str(column)}))
+    if not parts:
+        return pd.DataFrame(columns=[x, value, series])
+    return pd.concat(parts, ignore_index=True)
+
+class ChartCache:
+    """Chart payloads (downsampled long frames) keyed by (ticker, range, last bar, options).
+
+    A rerun with the same inputs reuses the payload instead of rebuilding it; a new bar
+    changes the key, so stale charts simply age out of the LRU.
+    """
+
+    def __init__(self, max_entries=MAX_CACHED_CHARTS):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        payload = build()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_chart_cache():
+    """Returns the process-wide chart payload cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ChartCache()
+        return _cache
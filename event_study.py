@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from price_store import BACKFILL_PERIOD, get_price_store
+
+DEFAULT_HORIZONS = (1, 5, 20)  # Forward returns in trading days
+# ✅ Regular-session close in local exchange time; a daily bar's Close is known from then on
+EXCHANGE_CLOSES = {
+    "America/New_York": pd.Timedelta(hours=16),
+    "America/Chicago": pd.Timedelta(hours=15),
+    "America/Toronto": pd.Timedelta(hours=16),
+    "Asia/Kolkata": pd.Timedelta(hours=15, minutes=30),
+    "Europe/London": pd.Timedelta(hours=16, minutes=30),
+    "Europe/Berlin": pd.Timedelta(hours=17, minutes=30),
+    "Europe/Paris": pd.Timedelta(hours=17, minutes=30),
+    "Asia/Tokyo": pd.Timedelta(hours=15),
+    "Asia/Hong_Kong": pd.Timedelta(hours=16),
+}
+DEFAULT_CLOSE = pd.Timedelta(hours=16)
+# Used when the price store has not recorded a ticker's exchange yet
+SUFFIX_TIMEZONES = {".NS": "Asia/Kolkata", ".BO": "Asia/Kolkata", ".L": "Europe/London", ".DE": "Europe/Berlin",
+                    ".PA": "Europe/Paris", ".T": "Asia/Tokyo", ".HK": "Asia/Hong_Kong", ".TO": "America/Toronto"}
+DEFAULT_TIMEZONE = "America/New_York"
+SENTIMENT_ORDER = ["Positive", "Neutral", "Negative"]
+
+def articles_frame(articles, ticker):
+    """Turns analyzed articles (dicts with `publishedAt` and `sentiment`) into an events frame."""
+    frame = pd.DataFrame(
+        [article for article in articles if isinstance(article, dict)] if isinstance(articles, list) else [],
+        columns=["title", "publishedAt", "sentiment"],
+    )
+    frame["ticker"] = ticker
+    return frame
+
+def exchange_timezone(ticker, store=None):
+    """Returns a ticker's exchange timezone: as recorded by the price store, else guessed from its suffix."""
+    timezone = store.timezone(ticker) if store is not None else None
+    if timezone:
+        return timezone
+    suffix = ticker[ticker.rfind("."):] if "." in ticker else ""
+    return SUFFIX_TIMEZONES.get(suffix.upper(), DEFAULT_TIMEZONE)
+
+def close_times(dates, timezone):
+    """UTC (naive) moments at which the daily bars dated `dates` closed on an exchange in `timezone`."""
+    local = pd.DatetimeIndex(dates) + EXCHANGE_CLOSES.get(timezone, DEFAULT_CLOSE)
+    return local.tz_localize(timezone).tz_convert("UTC").tz_localize(None)  # Daylight saving handled here
+
+def bars_frame(histories, horizons=DEFAULT_HORIZONS, timezones=None):
+    """Stacks per-ticker daily bars into one long frame with forward returns precomputed.
+
+    Each bar is timestamped at its exchange's local close (converted to UTC), the moment
+    its Close became known; `timezones` maps ticker -> exchange timezone (see
+    `exchange_timezone`). `fwd_<h>` is the return from that close to the close h bars later.
+    """
+    timezones = timezones or {}
+    frames = [
+        pd.DataFrame({
+            "ticker": ticker,
+            "bar_date": history.index,
+            "known_at": close_times(history.index, timezones.get(ticker) or exchange_timezone(ticker)),
+            "close": history["Close"].to_numpy(dtype="float64"),
+        })
+        for ticker, history in histories.items()
+        if history is not None and not history.empty
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["ticker", "bar_date", "close", "known_at", *[f"fwd_{h}" for h in horizons]])
+
+    bars = pd.concat(frames, ignore_index=True).sort_values(["ticker", "bar_date"], ignore_index=True)
+    closes = bars.groupby("ticker", sort=False)["close"]
+    for horizon in horizons:
+        bars[f"fwd_{horizon}"] = closes.shift(-horizon) / bars["close"] - 1
+    return bars
+
+def align_events(events, bars):
+    """As-of join: each article gets the last close known at its publication time, per ticker."""
+    events = events.copy()
+    events["published_at"] = pd.to_datetime(events["publishedAt"], utc=True, errors="coerce").dt.tz_localize(None)
+    events = events.dropna(subset=["published_at"]).sort_values("published_at", ignore_index=True)
+    if events.empty or bars.empty:
+        return events.assign(bar_date=pd.NaT)
+    return pd.merge_asof(
+        events, bars.sort_values("known_at"), left_on="published_at", right_on="known_at", by="ticker", direction="backward"
+    )
+
+def summarize_returns(aligned, horizons=DEFAULT_HORIZONS):
+    """Aggregates forward returns by sentiment label and horizon.
+
+    Returns one row per (sentiment, horizon) with the event count, mean and median return,
+    hit rate (share of positive returns) and a t-statistic for the mean.
+    """
+    columns = [f"fwd_{h}" for h in horizons]
+    present = [column for column in columns if column in aligned]
+    if not present:
+        return pd.DataFrame(columns=["sentiment", "horizon", "events", "mean", "median", "hit_rate", "t_stat"])
+
+    long = aligned.melt(id_vars=["sentiment"], value_vars=present, var_name="horizon", value_name="return").dropna(
+        subset=["return"]
+    )
+    long["horizon"] = long["horizon"].str[len("fwd_"):].astype(int)
+    long["hit"] = long["return"] > 0
+    grouped = long.groupby(["sentiment", "horizon"])
+    summary = grouped["return"].agg(events="count", mean="mean", median="median", std="std")
+    summary["hit_rate"] = grouped["hit"].mean()
+    summary["t_stat"] = summary["mean"] / (summary["std"] / np.sqrt(summary["events"])).replace(0, np.nan)
+    summary = summary.drop(columns="std").reset_index()
+
+    order = {label: rank for rank, label in enumerate(SENTIMENT_ORDER)}
+    summary["_order"] = summary["sentiment"].map(order).fillna(len(order))
+    return summary.sort_values(["_order", "sentiment", "horizon"]).drop(columns="_order").reset_index(drop=True)
+
+def event_study(events, histories=None, horizons=DEFAULT_HORIZONS):
+    """Forward returns after news, by sentiment.
+
+    `events` is a frame with `ticker`, `publishedAt` and `sentiment` columns (see
+    `articles_frame`), for any number of tickers. Price history comes from `histories`
+    (ticker -> OHLCV frame) or the local price store. Returns (aligned events, summary).
+    """
+    store = get_price_store()
+    if histories is None:
+        histories = {ticker: store.history(ticker, period=BACKFILL_PERIOD) for ticker in events["ticker"].dropna().unique()}
+    timezones = {ticker: exchange_timezone(ticker, store) for ticker in histories}
+    aligned = align_events(events, bars_frame(histories, horizons, timezones))
+    return aligned, summarize_returns(aligned, horizons)
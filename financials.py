@@ -0,0 +1,168 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+# ✅ yfinance attributes per statement (annual, quarterly)
+STATEMENTS = {
+    "income": ("income_stmt", "quarterly_income_stmt"),
+    "balance": ("balance_sheet", "quarterly_balance_sheet"),
+    "cashflow": ("cashflow", "quarterly_cashflow"),
+}
+# Expected gap between period end and the next filing's period end, plus the filing delay
+PERIOD_LENGTH = {False: pd.Timedelta(days=365), True: pd.Timedelta(days=91)}
+FILING_LAG = {False: pd.Timedelta(days=90), True: pd.Timedelta(days=45)}
+MIN_TTL = 6 * 3600  # Re-check this often once a new report is due
+MAX_TTL = 7 * 24 * 3600  # ...and at least weekly otherwise (restatements, late filers)
+RETRY_TTL = 5 * 60  # After a failed fetch, retry this soon
+
+# ✅ Ratio name -> (numerator item, denominator item)
+RATIOS = {
+    "Gross Margin": ("Gross Profit", "Total Revenue"),
+    "Operating Margin": ("Operating Income", "Total Revenue"),
+    "Net Margin": ("Net Income", "Total Revenue"),
+    "ROE": ("Net Income", "Stockholders Equity"),
+    "ROA": ("Net Income", "Total Assets"),
+    "Debt / Equity": ("Total Debt", "Stockholders Equity"),
+    "Current Ratio": ("Current Assets", "Current Liabilities"),
+    "FCF Margin": ("Free Cash Flow", "Total Revenue"),
+}
+
+_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="financials")
+# Peer lookups wait on statement fetches, so they run on their own pool (never starving _executor)
+_peer_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="financials-peers")
+
+class Statements:
+    """One ticker's statements as compact arrays.
+
+    Each statement is a float64 matrix (line item x period, newest period first) plus its
+    item names; all statements share the union of reporting periods, NaN where missing.
+    """
+
+    def __init__(self, ticker, quarterly, frames):
+        self.ticker = ticker
+        self.quarterly = quarterly
+        frames = {name: frame for name, frame in frames.items() if frame is not None and not frame.empty}
+        periods = sorted({pd.Timestamp(column) for frame in frames.values() for column in frame.columns}, reverse=True)
+        self.periods = pd.DatetimeIndex(periods)
+        self.items = {}
+        self.values = {}
+        for name in STATEMENTS:
+            frame = frames.get(name)
+            if frame is None:
+                self.items[name], self.values[name] = [], np.empty((0, len(self.periods)))
+                continue
+            frame = frame.copy()
+            frame.columns = pd.DatetimeIndex([pd.Timestamp(column) for column in frame.columns])
+            frame = frame.T.groupby(level=0).first().T.reindex(columns=self.periods)  # Drops duplicate periods
+            self.items[name] = list(frame.index)
+            self.values[name] = frame.apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64")
+
+    @property
+    def empty(self):
+        return not any(len(items) for items in self.items.values())
+
+    def item(self, name):
+        """Returns one line item's values across periods (searching all statements), or NaNs."""
+        for statement, items in self.items.items():
+            if name in items:
+                return self.values[statement][items.index(name)]
+        return np.full(len(self.periods), np.nan)
+
+    def latest(self, names):
+        """Most recent non-missing value of each line item."""
+        result = np.full(len(names), np.nan)
+        for position, name in enumerate(names):
+            values = self.item(name)
+            reported = values[~np.isnan(values)]
+            if len(reported):
+                result[position] = reported[0]
+        return result
+
+    def frame(self, statement):
+        """Returns a statement as a DataFrame (items x periods), like yfinance's own."""
+        return pd.DataFrame(self.values[statement], index=self.items[statement], columns=self.periods)
+
+    def expires_at(self, now=None):
+        """Cache deadline: wait until the next report is due, then poll every MIN_TTL."""
+        now = now or time.time()
+        if not len(self.periods):
+            return now + MIN_TTL
+        due = (self.periods[0] + PERIOD_LENGTH[self.quarterly] + FILING_LAG[self.quarterly]).timestamp()
+        return now + min(max(due - now, MIN_TTL), MAX_TTL)
+
+def _fetch_statement(ticker, attribute):
+    return getattr(yf.Ticker(ticker), attribute)
+
+class FinancialsService:
+    """Fetches, caches and compares financial statements.
+
+    The three statements of a ticker (and the tickers of a peer group) are fetched
+    concurrently; results are cached until their next report is expected (see
+    `Statements.expires_at`), so page interactions never refetch them.
+    """
+
+    def __init__(self):
+        self._cache = {}  # (ticker, quarterly) -> (expires at, Statements)
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _lock_for(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def statements(self, ticker, quarterly=False, timeout=20):
+        """Returns the cached or freshly fetched `Statements` for a ticker."""
+        key = (ticker.upper(), quarterly)
+        with self._lock_for(key):
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.time():
+                return cached[1]
+
+            attributes = {name: attributes[quarterly] for name, attributes in STATEMENTS.items()}
+            futures = {name: _executor.submit(_fetch_statement, key[0], attribute) for name, attribute in attributes.items()}
+            frames, failed = {}, False
+            for name, future in futures.items():
+                try:
+                    frames[name] = future.result(timeout=timeout)
+                except Exception:
+                    failed = True
+                    # Keep serving the last good copy of a statement while the upstream is failing
+                    frames[name] = cached[1].frame(name) if cached and cached[1].items[name] else None
+
+            statements = Statements(key[0], quarterly, frames)
+            # An incomplete result is only kept briefly, so a recovered upstream fills the gaps
+            expires_at = time.time() + RETRY_TTL if failed else statements.expires_at()
+            self._cache[key] = (expires_at, statements)
+            return statements
+
+    def peer_ratios(self, tickers, quarterly=False):
+        """Returns a tickers x ratios DataFrame from each ticker's latest reported values.
+
+        Line items are gathered into one (ticker x item) matrix and every ratio is a single
+        array division over the whole peer group.
+        """
+        tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        futures = [_peer_executor.submit(self.statements, ticker, quarterly) for ticker in tickers]
+        items = sorted({item for pair in RATIOS.values() for item in pair})
+        matrix = np.vstack([future.result().latest(items) for future in futures]) if tickers else np.empty((0, len(items)))
+
+        column = {item: position for position, item in enumerate(items)}
+        numerators = matrix[:, [column[numerator] for numerator, _ in RATIOS.values()]]
+        denominators = matrix[:, [column[denominator] for _, denominator in RATIOS.values()]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(denominators != 0, numerators / denominators, np.nan)
+        return pd.DataFrame(ratios, index=pd.Index(tickers, name="Ticker"), columns=list(RATIOS))
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_financials_service():
+    """Returns the process-wide financials service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = FinancialsService()
+        return _service
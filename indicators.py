@@ -0,0 +1,173 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from price_store import BACKFILL_PERIOD, get_price_store, period_start
+
+TRADING_DAYS = 252
+MAX_CACHED = 256  # Tickers whose indicator frames are kept in memory
+
+# ✅ Default indicator set: column name -> (function, parameters)
+DEFAULT_INDICATORS = {
+    "SMA 20": ("sma", {"window": 20}),
+    "SMA 50": ("sma", {"window": 50}),
+    "EMA 20": ("ema", {"span": 20}),
+    "RSI 14": ("rsi", {"window": 14}),
+    "Volatility 20d": ("volatility", {"window": 20}),
+    "Drawdown": ("drawdown", {}),
+    "Volume z-score": ("volume_zscore", {"window": 20}),
+}
+PRICE_OVERLAYS = {"sma", "ema"}  # Indicators drawn on the price axis rather than their own panel
+
+# All functions take a Series (one ticker) or a wide DataFrame (one column per ticker)
+# and operate column-wise, so tickers sharing a calendar are computed in one vectorized pass.
+
+def sma(close, window=20):
+    return close.rolling(window, min_periods=window).mean()
+
+def ema(close, span=20):
+    return close.ewm(span=span, adjust=False, min_periods=span).mean()
+
+def rsi(close, window=14):
+    """Wilder's RSI (0-100), using exponential smoothing with alpha = 1 / window."""
+    change = close.diff()
+    gain = change.clip(lower=0).ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+    loss = (-change.clip(upper=0)).ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+    strength = gain / loss.replace(0, np.nan)
+    return (100 - 100 / (1 + strength)).where(loss != 0, 100.0).where(gain.notna())
+
+def volatility(close, window=20):
+    """Annualized rolling standard deviation of daily log returns."""
+    returns = np.log(close / close.shift(1))
+    return returns.rolling(window, min_periods=window).std() * np.sqrt(TRADING_DAYS)
+
+def drawdown(close):
+    """Fractional distance below the running peak (0 at a new high, -0.25 for 25% down)."""
+    return close / close.cummax() - 1
+
+def volume_zscore(volume, window=20):
+    volume = volume.astype("float64")
+    rolling = volume.rolling(window, min_periods=window)
+    return (volume - rolling.mean()) / rolling.std().replace(0, np.nan)
+
+FUNCTIONS = {"sma": sma, "ema": ema, "rsi": rsi, "volatility": volatility, "drawdown": drawdown, "volume_zscore": volume_zscore}
+
+def compute_indicators(history, indicators=None):
+    """Returns a DataFrame of indicator columns (plus Close) for one ticker's OHLCV history."""
+    panel = compute_panel({"_": history}, indicators)
+    return pd.DataFrame({name: frame["_"] for name, frame in panel.items()})
+
+def compute_panel(histories, indicators=None):
+    """Computes indicators for many tickers at once.
+
+    `histories` maps ticker -> OHLCV DataFrame. Tickers with identical trading dates are
+    stacked into wide (date x ticker) frames and each indicator is one rolling/ewm call per
+    such group; every ticker's windows cover only its own bars, so its values never depend
+    on which other tickers are in the batch. Returns a dict of indicator name -> wide
+    DataFrame (NaN on dates a ticker did not trade), including "Close".
+    """
+    indicators = indicators or DEFAULT_INDICATORS
+    histories = {ticker: frame for ticker, frame in histories.items() if frame is not None and not frame.empty}
+    if not histories:
+        return {name: pd.DataFrame() for name in ["Close", *indicators]}
+
+    calendars = {}
+    for ticker, frame in histories.items():
+        calendars.setdefault(pd.DatetimeIndex(frame.index).asi8.tobytes(), []).append(ticker)
+
+    parts = {name: [] for name in ["Close", *indicators]}
+    for tickers in calendars.values():
+        close = pd.DataFrame({ticker: histories[ticker]["Close"] for ticker in tickers}).astype("float64")
+        volume = pd.DataFrame({ticker: histories[ticker]["Volume"] for ticker in tickers})
+        parts["Close"].append(close)
+        for name, (function, params) in indicators.items():
+            source = volume if function == "volume_zscore" else close
+            parts[name].append(FUNCTIONS[function](source, **params))
+    return {name: pd.concat(frames, axis=1).sort_index() for name, frames in parts.items()}
+
+def last_bar_key(history):
+    """Identifies a history's last bar by date, close and volume, so a still-forming bar is noticed."""
+    last = history.iloc[-1]
+    return history.index[-1], float(last["Close"]), float(last["Volume"])
+
+class IndicatorCache:
+    """Per-ticker indicator frames over the full stored history, keyed by the last bar (see `last_bar_key`).
+
+    Indicators are computed on everything in the price store (so rolling windows are warm at
+    the start of any displayed range) and sliced per request; a frame is only recomputed
+    when the store gains a new bar or today's partial bar moves.
+    """
+
+    def __init__(self, max_entries=MAX_CACHED):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # ticker -> (last bar, indicator names, frame)
+        self._lock = threading.Lock()
+
+    def _cached(self, ticker, last_bar, names):
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry and entry[0] == last_bar and entry[1] == names:
+                self._entries.move_to_end(ticker)
+                return entry[2]
+        return None
+
+    def _store(self, ticker, last_bar, names, frame):
+        with self._lock:
+            self._entries[ticker] = (last_bar, names, frame)
+            self._entries.move_to_end(ticker)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def panel(self, tickers, period="6mo", indicators=None, refresh=True):
+        """Returns {indicator name -> wide DataFrame (date x ticker)} for `period`.
+
+        Only tickers whose last bar (date, close or volume) changed since the previous call
+        are recomputed, and those are computed together in batched passes (one per trading
+        calendar).
+        """
+        indicators = indicators or DEFAULT_INDICATORS
+        names = tuple(indicators)
+        store = get_price_store()
+        if refresh and len(tickers) > 1:
+            store.backfill(tickers)  # New tickers arrive in bulk requests instead of one call each
+
+        frames, stale = {}, {}
+        for ticker in dict.fromkeys(tickers):
+            history = store.history(ticker, period=BACKFILL_PERIOD, refresh=refresh)
+            if history.empty:
+                continue
+            last_bar = last_bar_key(history)
+            cached = self._cached(ticker, last_bar, names)
+            if cached is not None:
+                frames[ticker] = cached
+            else:
+                stale[ticker] = history
+
+        if stale:
+            computed = compute_panel(stale, indicators)
+            for ticker, history in stale.items():
+                frame = pd.DataFrame({name: wide[ticker] for name, wide in computed.items()}).loc[history.index]
+                self._store(ticker, last_bar_key(history), names, frame)
+                frames[ticker] = frame
+
+        start = period_start(period)
+        return {
+            name: pd.DataFrame({ticker: frame.loc[frame.index >= start, name] for ticker, frame in frames.items()})
+            for name in ["Close", *names]
+        }
+
+    def indicators(self, ticker, period="6mo", indicators=None, refresh=True):
+        """Returns one ticker's indicator columns (plus Close) for `period`."""
+        panel = self.panel([ticker], period, indicators, refresh)
+        return pd.DataFrame({name: wide[ticker] for name, wide in panel.items() if ticker in wide})
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_indicator_cache():
+    """Returns the process-wide indicator cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = IndicatorCache()
+        return _cache
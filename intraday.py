@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+RING_CAPACITY = 5 * 390  # One-minute bars kept per ticker: five regular sessions
+MAX_TICKERS = 32  # Buffers kept in memory; least recently polled are dropped first
+POLL_SECONDS = 30  # Minimum gap between upstream requests per ticker
+MAX_LOOKBACK = pd.Timedelta(days=7)  # Yahoo only serves one-minute bars this far back
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+class BarRing:
+    """Fixed-size ring buffer of one-minute bars (timestamps plus OHLCV in numpy arrays).
+
+    Memory is allocated once; when full, the oldest bars are overwritten. Appends are
+    deduplicated by timestamp: bars older than the newest stored one are ignored, and a
+    bar with the same timestamp replaces it (the last minute is usually still forming).
+    """
+
+    def __init__(self, capacity=RING_CAPACITY):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype="int64")  # UTC nanoseconds
+        self.values = np.zeros((capacity, len(COLUMNS)), dtype="float64")
+        self.start = 0
+        self.size = 0
+
+    @property
+    def last_time(self):
+        if not self.size:
+            return None
+        return pd.Timestamp(int(self.times[(self.start + self.size - 1) % self.capacity]))
+
+    def append(self, bars):
+        """Adds bars (a DataFrame indexed by UTC-naive timestamps); returns how many were new."""
+        if bars is None or bars.empty:
+            return 0
+        times = pd.DatetimeIndex(bars.index).as_unit("ns").asi8
+        values = bars[COLUMNS].to_numpy(dtype="float64")
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+        times, last_positions = np.unique(times[::-1], return_index=True)  # Later duplicates win
+        values = values[::-1][last_positions]
+
+        if self.size:
+            last_slot = (self.start + self.size - 1) % self.capacity
+            newest = self.times[last_slot]
+            if times[0] <= newest:
+                same = times == newest
+                if same.any():
+                    self.values[last_slot] = values[same][0]
+                keep = times > newest
+                times, values = times[keep], values[keep]
+        if not len(times):
+            return 0
+
+        if len(times) > self.capacity:
+            times, values = times[-self.capacity:], values[-self.capacity:]
+        slots = (self.start + self.size + np.arange(len(times))) % self.capacity
+        self.times[slots] = times
+        self.values[slots] = values
+        overflow = max(self.size + len(times) - self.capacity, 0)
+        self.start = (self.start + overflow) % self.capacity
+        self.size = min(self.size + len(times), self.capacity)
+        return len(times)
+
+    def frame(self):
+        """Returns the buffered bars oldest-first as an OHLCV DataFrame."""
+        slots = (self.start + np.arange(self.size)) % self.capacity
+        index = pd.DatetimeIndex(self.times[slots].astype("datetime64[ns]"), name="Datetime")
+        return pd.DataFrame(self.values[slots], index=index, columns=COLUMNS)
+
+class IntradayFeed:
+    """Polls one-minute bars incrementally into a BarRing per ticker.
+
+    The first poll loads today's session; later polls only request bars from the last
+    stored minute onward (the overlap is deduplicated by the ring), and no ticker hits
+    Yahoo more than once per POLL_SECONDS however many viewers are refreshing.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY, max_tickers=MAX_TICKERS, poll_seconds=POLL_SECONDS):
+        self.capacity = capacity
+        self.max_tickers = max_tickers
+        self.poll_seconds = poll_seconds
+        self._buffers = OrderedDict()  # ticker -> [BarRing, lock, last poll time]
+        self._lock = threading.Lock()
+
+    def _entry(self, ticker):
+        with self._lock:
+            entry = self._buffers.get(ticker)
+            if entry is None:
+                entry = self._buffers[ticker] = [BarRing(self.capacity), threading.Lock(), 0.0]
+            self._buffers.move_to_end(ticker)
+            while len(self._buffers) > self.max_tickers:
+                self._buffers.popitem(last=False)
+            return entry
+
+    def _download(self, ticker, since):
+        if since is None or pd.Timestamp.now("UTC").tz_localize(None) - since > MAX_LOOKBACK:
+            frame = yf.Ticker(ticker).history(period="1d", interval="1m", auto_adjust=True)
+        else:
+            frame = yf.Ticker(ticker).history(start=since.tz_localize("UTC"), interval="1m", auto_adjust=True)
+        if not frame.empty:
+            frame.index = pd.DatetimeIndex(frame.index).tz_convert("UTC").tz_localize(None)
+        return frame
+
+    def poll(self, ticker, force=False):
+        """Fetches bars newer than the buffer's last one (rate limited); returns how many were added."""
+        entry = self._entry(ticker)
+        ring, lock, _ = entry
+        with lock:
+            if not force and time.time() - entry[2] < self.poll_seconds:
+                return 0
+            entry[2] = time.time()
+            return ring.append(self._download(ticker, ring.last_time))
+
+    def bars(self, ticker, poll=True):
+        """Returns the buffered one-minute bars for a ticker, polling first when due."""
+        if poll:
+            self.poll(ticker)
+        ring, lock, _ = self._entry(ticker)
+        with lock:
+            return ring.frame()
+
+_feed = None
+_feed_lock = threading.Lock()
+
+def get_intraday_feed():
+    """Returns the process-wide intraday feed."""
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = IntradayFeed()
+        return _feed
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+CHUNK_SIZE = 50  # Tickers per Yahoo request
+MAX_PARALLEL_CHUNKS = 4  # Requests in flight at once
+PRICE_FIELDS = ["Open", "High", "Low", "Close"]
+FIELDS = [*PRICE_FIELDS, "Volume"]
+
+def chunked(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _download_chunk(tickers, period, interval, start=None, end=None, timeout=30):
+    frame = yf.download(
+        tickers, period=None if start else period, start=start, end=end, interval=interval,
+        group_by="column", auto_adjust=True, threads=False, progress=False, timeout=timeout,
+    )
+    if frame is None or frame.empty:
+        return pd.DataFrame()
+    if not isinstance(frame.columns, pd.MultiIndex):  # Older yfinance: flat columns for a single ticker
+        frame.columns = pd.MultiIndex.from_product([frame.columns, tickers])
+    frame = frame.loc[:, frame.columns.get_level_values(0).isin(FIELDS)]
+    frame.index = pd.DatetimeIndex(frame.index).tz_localize(None)
+    return frame
+
+def compact_panel(frame, tickers, price_dtype=np.float32):
+    """Converts a (field, ticker) download into compact dtypes.
+
+    Prices become `price_dtype` (float32 for display; pass float64 for data that is kept)
+    and volumes int64 (0 where there was no trading). The ticker column level is
+    categorical, and every requested ticker is present, all-NaN if missing.
+    """
+    tickers = pd.CategoricalIndex(tickers, categories=tickers, name="Ticker")
+    columns = pd.MultiIndex.from_product([FIELDS, tickers], names=["Field", "Ticker"])
+    if frame.empty:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"), columns=columns).astype(
+            {column: price_dtype if column[0] != "Volume" else np.int64 for column in columns}
+        )
+
+    parts = {}
+    for field in FIELDS:
+        values = frame[field].reindex(columns=list(tickers)) if field in frame.columns.get_level_values(0) else None
+        if values is None:
+            values = pd.DataFrame(np.nan, index=frame.index, columns=list(tickers))
+        parts[field] = values.fillna(0).astype(np.int64) if field == "Volume" else values.astype(price_dtype)
+
+    panel = pd.concat(parts, axis=1)
+    panel.columns = columns
+    panel.index.name = "Date"
+    return panel.sort_index()
+
+def download_panel(tickers, period="6mo", interval="1d", start=None, end=None,
+                   chunk_size=CHUNK_SIZE, max_workers=MAX_PARALLEL_CHUNKS, price_dtype=np.float32):
+    """Downloads OHLCV for many tickers with one Yahoo request per chunk.
+
+    Chunks of `chunk_size` tickers are fetched with at most `max_workers` requests in
+    flight. Returns a wide frame with (field, ticker) columns, e.g. `panel["Close"]` is a
+    date x ticker float32 frame (see `compact_panel`). Tickers are upper-cased. Chunks that
+    failed are listed in `panel.attrs["errors"]`.
+    """
+    tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker and ticker.strip()))
+    chunks = chunked(tickers, chunk_size)
+    frames, errors = [], {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks) or 1)), thread_name_prefix="market-data") as pool:
+        futures = [(chunk, pool.submit(_download_chunk, chunk, period, interval, start, end)) for chunk in chunks]
+        for chunk, future in futures:
+            try:
+                frame = future.result()
+                if not frame.empty:
+                    frames.append(frame)
+            except Exception as e:
+                errors[",".join(chunk)] = str(e)
+
+    combined = pd.concat(frames, axis=1) if frames else pd.DataFrame()
+    panel = compact_panel(combined, tickers, price_dtype)
+    panel.attrs["errors"] = errors
+    return panel
+
+def panel_history(panel, ticker):
+    """Returns one ticker's OHLCV from a panel, shaped like `yf.Ticker.history` (missing days dropped)."""
+    history = panel.xs(ticker.strip().upper(), axis=1, level="Ticker")
+    history.columns = list(history.columns)
+    return history.dropna(subset=["Close"])
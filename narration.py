@@ -0,0 +1,98 @@
+from collections import Counter
+from string import Formatter
+from summarizer import summarize_articles
+
+# ✅ Default spoken-script length; synthesis time grows with text length, so keep it bounded
+NARRATION_MAX_CHARS = 700
+
+# ✅ Fixed templates per language (headlines themselves are spoken as published)
+TEMPLATES = {
+    "en": {
+        "intro": "Here is your news briefing for {company}.",
+        "counts": "Out of {total} articles, {positive} are positive, {negative} are negative and {neutral} are neutral.",
+        "overall": "Overall sentiment is {overall}.",
+        "headlines": "Here are the latest headlines.",
+        "outro": "That's all for {company}.",
+        "labels": {"Positive": "positive", "Negative": "negative", "Neutral": "neutral", "Mixed": "mixed"},
+    },
+    "hi": {
+        "intro": "{company} के लिए आपकी समाचार ब्रीफ़िंग।",
+        "counts": "कुल {total} लेखों में से {positive} सकारात्मक, {negative} नकारात्मक और {neutral} तटस्थ हैं।",
+        "overall": "कुल मिलाकर भावना {overall} है।",
+        "headlines": "ये हैं ताज़ा सुर्खियाँ।",
+        "outro": "{company} के लिए बस इतना ही।",
+        "labels": {"Positive": "सकारात्मक", "Negative": "नकारात्मक", "Neutral": "तटस्थ", "Mixed": "मिली-जुली"},
+    },
+}
+
+def as_sentence(text):
+    """Adds a full stop so consecutive headlines are spoken as separate sentences."""
+    text = text.strip()
+    return text if text.endswith((".", "!", "?", "।")) else f"{text}."
+
+def overall_sentiment(distribution):
+    """Returns the dominant sentiment label, or "Mixed" when positives and negatives tie."""
+    positive, negative = distribution.get("Positive", 0), distribution.get("Negative", 0)
+    if positive == negative:
+        return "Neutral" if positive == 0 else "Mixed"
+    return "Positive" if positive > negative else "Negative"
+
+# Fields with few distinct values: sentences using only these recur across briefings
+RECURRING_FIELDS = {"company", "overall"}
+
+def template_segments(template_text, **values):
+    """Fills in a template sentence and returns it as one (text, fixed) segment.
+
+    Sentences are synthesized whole, so each keeps natural intonation; `fixed` marks
+    sentences that recur across briefings (no fields, or only the company name or overall
+    label), which a segment library keeps in memory. Others are cached by their filled-in text.
+    """
+    fields = {field for _, field, _, _ in Formatter().parse(template_text) if field is not None}
+    return [(template_text.format(**values).strip(), fields <= RECURRING_FIELDS)]
+
+def build_narration_segments(company, articles, sentiment_distribution=None, lang="en", max_chars=NARRATION_MAX_CHARS):
+    """Builds a short spoken briefing as ordered (text, fixed) segments totalling at most `max_chars` characters.
+
+    Each segment is a whole sentence; fixed ones recur across briefings, so a segment library
+    can synthesize them once and reuse them.
+    """
+    template = TEMPLATES.get(lang, TEMPLATES["en"])
+    articles = articles if isinstance(articles, list) else []
+    distribution = Counter(sentiment_distribution or [article.get("sentiment", "Neutral") for article in articles])
+
+    opening = (
+        template_segments(template["intro"], company=company)
+        + template_segments(
+            template["counts"],
+            total=sum(distribution.values()),
+            positive=distribution.get("Positive", 0),
+            negative=distribution.get("Negative", 0),
+            neutral=distribution.get("Neutral", 0),
+        )
+        + template_segments(template["overall"], overall=template["labels"][overall_sentiment(distribution)])
+    )
+    headlines = template_segments(template["headlines"])
+    closing = template_segments(template["outro"], company=company)
+
+    # ✅ Whatever the fixed parts leave over goes to the most salient headlines
+    fixed = joined_length(opening + headlines + closing)
+    budget = max_chars - fixed - 1
+    highlights = [(as_sentence(text), False) for text in summarize_articles(articles, max_chars=budget)] if budget > 0 else []
+    while highlights and fixed + joined_length(highlights) + 1 > max_chars:
+        highlights.pop()  # Added full stops can push the last highlight over budget
+    if highlights:
+        opening = opening + headlines + highlights
+
+    segments = opening + closing
+    while len(segments) > 1 and joined_length(segments) > max_chars:
+        segments.pop()
+    return segments
+
+def joined_length(segments):
+    """Length of the script the segments produce when joined with single spaces."""
+    return sum(len(text) for text, _ in segments) + max(len(segments) - 1, 0)
+
+def build_narration(company, articles, sentiment_distribution=None, lang="en", max_chars=NARRATION_MAX_CHARS):
+    """Builds a short spoken briefing (English or Hindi) of at most `max_chars` characters."""
+    segments = build_narration_segments(company, articles, sentiment_distribution, lang=lang, max_chars=max_chars)
+    return " ".join(text for text, _ in segments)
@@ -50,6 +50,7 @@ def get_news(company_name, num_articles=10):
                 "title": article["title"],
                 "summary": article["description"] or "No summary available.",
                 "link": article["url"],
+                "publishedAt": article.get("publishedAt"),
                 "sentiment": analyze_sentiment(article["title"])  # ✅ Apply sentiment analysis here
             }
             for article in articles
@@ -60,6 +61,32 @@ def get_news(company_name, num_articles=10):
     except Exception as e:
         return {"error": f"Exception occurred: {str(e)}"}
 
+def iter_news(company_name, max_articles=100, page_size=20):
+    """Yields analyzed articles page by page, so callers can start processing before the fetch finishes."""
+    fetched = 0
+    page = 1
+    while fetched < max_articles:
+        url = f"https://newsapi.org/v2/everything?q={company_name}&language=en&sortBy=publishedAt&pageSize={page_size}&page={page}&apiKey={NEWSAPI_KEY}"
+        response = requests.get(url)
+        if response.status_code != 200:
+            return
+
+        news_data = response.json()
+        articles = news_data.get("articles", []) if news_data.get("status") == "ok" else []
+        if not articles:
+            return
+
+        for article in articles[: max_articles - fetched]:
+            yield {
+                "title": article["title"],
+                "summary": article["description"] or "No summary available.",
+                "link": article["url"],
+                "publishedAt": article.get("publishedAt"),
+                "sentiment": analyze_sentiment(article["title"]),
+            }
+            fetched += 1
+        page += 1
+
 # Test function
 if __name__ == "__main__":
     company = "Tesla"
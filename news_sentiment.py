@@ -2,10 +2,15 @@ import requests
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 from collections import Counter
-import pyttsx3
-from gtts import gTTS
 import os
 from news_scraper import get_news  # Import the scraper
+from narration import build_narration
+from tts_backends import get_registry
+from script_router import script_language, synthesize_mixed
+from tts_output import write_output
+from audio_utils import DEFAULT_FORMAT, detect_format, transcode
+from segment_library import get_segment_library
+from topic_analysis import ContrastTracker, TopicClusterer, cluster_topics, find_contrasting_pairs
 
 # ✅ Download VADER lexicon (if not already downloaded)
 nltk.download("vader_lexicon")
@@ -30,7 +35,7 @@ def analyze_sentiment(text):
     except Exception as e:
         return f"Error: {str(e)}"
 
-def comparative_analysis(news_list):
+def comparative_analysis(news_list, top_k=5):
     """Analyzes sentiment distribution and topic coverage."""
     try:
         if not news_list or "error" in news_list:
@@ -40,15 +45,9 @@ def comparative_analysis(news_list):
 
         sentiment_summary = {
             "Sentiment Distribution": dict(sentiment_counts),
-            "Coverage Differences": [
-                {
-                    "Comparison": f"Article '{a1['title']}' vs. Article '{a2['title']}'",
-                    "Impact": f"One is {a1['sentiment']} while the other is {a2['sentiment']}.",
-                }
-                for i, a1 in enumerate(news_list)
-                for j, a2 in enumerate(news_list)
-                if i < j and a1["sentiment"] != a2["sentiment"]
-            ]
+            # ✅ Only pair articles that cover the same story with opposite sentiment
+            "Coverage Differences": find_contrasting_pairs(news_list, top_k=top_k),
+            "Topic Coverage": cluster_topics(news_list),
         }
 
         return sentiment_summary
@@ -56,26 +55,96 @@ def comparative_analysis(news_list):
     except Exception as e:
         return {"error": f"Exception in comparative analysis: {str(e)}"}
 
-def text_to_speech(text, lang="en"):
-    """Uses `pyttsx3` for English and `gTTS` for Hindi."""
+class StreamingComparativeAnalysis:
+    """Incremental version of `comparative_analysis` for article iterators.
+
+    Articles are consumed in small batches; `report()` can be called at any time and
+    returns the same keys as `comparative_analysis`. State is bounded (counters, a
+    window of recent articles and the cluster centroids), so memory stays flat.
+    """
+
+    def __init__(self, top_k=5, n_clusters=8, batch_size=20, window=500):
+        self.batch_size = batch_size
+        self.article_count = 0
+        self.sentiment_counts = Counter()
+        self.contrasts = ContrastTracker(top_k=top_k, window=window)
+        self.topics = TopicClusterer(n_clusters=n_clusters)
+        self._batch = []
+
+    def update(self, article):
+        """Adds one article; statistics are refreshed every `batch_size` articles."""
+        if not isinstance(article, dict) or "title" not in article:
+            return self
+        self.article_count += 1
+        self.sentiment_counts[article.get("sentiment", "Neutral")] += 1
+        self._batch.append(article)
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+        return self
+
+    def _flush(self):
+        batch, self._batch = self._batch, []
+        if batch:
+            self.contrasts.update(batch)
+            self.topics.partial_fit(batch)
+
+    def report(self, final=False):
+        """Returns an intermediate (or, with `final=True`, closing) report over every article seen so far."""
+        self._flush()
+        if not self.article_count:
+            return {"error": "No valid news data to analyze."}
+        return {
+            "Sentiment Distribution": dict(self.sentiment_counts),
+            "Coverage Differences": self.contrasts.report(),
+            "Topic Coverage": self.topics.report(flush=final),
+        }
+
+def comparative_analysis_stream(articles, report_every=50, **kwargs):
+    """Consumes an iterator of articles, yielding an intermediate report every `report_every` articles and a final one at the end."""
+    analysis = StreamingComparativeAnalysis(**kwargs)
+    try:
+        for article in articles:
+            seen = analysis.article_count
+            analysis.update(article)
+            # Skipped (invalid) items leave the count unchanged and must not repeat a report
+            if analysis.article_count > seen and analysis.article_count % report_every == 0:
+                yield analysis.report()
+        yield analysis.report(final=True)
+
+    except Exception as e:
+        yield {"error": f"Exception in comparative analysis: {str(e)}"}
+
+def synthesize_speech(text, lang="en", fmt=DEFAULT_FORMAT, bitrate_kbps=None):
+    """Returns speech audio as `fmt` bytes from the best available backends (Hindi and English runs routed separately)."""
+    return transcode(synthesize_mixed(text, lang), fmt, bitrate_kbps)
+
+def synthesize_narration(segments, lang="en", fmt=DEFAULT_FORMAT, bitrate_kbps=None):
+    """Renders narration segments (see `narration.build_narration_segments`), reusing audio for recurring phrases."""
+    library = get_segment_library()
+    audio = get_registry().run(
+        lang,
+        lambda backend: library.render(
+            segments,
+            lang,
+            backend.name,
+            lambda text: backend.synthesize(text, script_language(text, lang)),  # English names keep an English voice
+            voice=backend.voice,
+            rate=backend.rate,
+            fmt=backend.fmt,
+        ),
+    )
+    return transcode(audio, fmt, bitrate_kbps)
+
+def text_to_speech(text, lang="en", fmt=DEFAULT_FORMAT, bitrate_kbps=None):
+    """Synthesizes speech and saves it to a per-job file (see `synthesize_speech` for in-memory use)."""
     try:
         if not text:
             return "Error: No text provided for speech conversion."
 
-        filename = f"speech_output_{lang}.mp3"
-
-        if lang == "en":
-            # ✅ Use `pyttsx3` for English (Offline)
-            engine = pyttsx3.init()
-            engine.setProperty("rate", 180)
-            engine.save_to_file(text, filename)
-            engine.runAndWait()
-        else:
-            # ✅ Use `gTTS` for Hindi (Online)
-            tts = gTTS(text=text, lang="hi", slow=False)
-            tts.save(filename)
+        audio = synthesize_speech(text, lang=lang, fmt=fmt, bitrate_kbps=bitrate_kbps)
 
-        return filename  # Return saved file path
+        # ✅ Each job gets its own file, so concurrent sessions never overwrite each other
+        return write_output(audio, lang, ext=detect_format(audio))  # Return saved file path
 
     except Exception as e:
         return f"Error in TTS conversion: {str(e)}"
@@ -94,6 +163,7 @@ if __name__ == "__main__":
 
         # ✅ Ask for Language Choice
         language_choice = input("Enter 'hi' for Hindi or 'en' for English TTS: ").strip().lower()
-        speech_output = text_to_speech(str(sentiment_report), lang=language_choice)
+        narration = build_narration(company, news_data, sentiment_report.get("Sentiment Distribution"), lang=language_choice)
+        speech_output = text_to_speech(narration, lang=language_choice)
         print(f"\n🔊 Speech saved at: {speech_output}")
         os.system(f"start {speech_output}")  # ✅ Play the audio file (Windows)
@@ -0,0 +1,174 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+import threading
+import time
+import pandas as pd
+import yfinance as yf
+from market_data import download_panel, panel_history
+
+# ✅ Local bar store location (override via environment)
+PRICE_STORE_PATH = os.environ.get(
+    "PRICE_STORE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "price_history.sqlite")
+)
+BACKFILL_PERIOD = "5y"  # Fetched once per ticker so every shorter range is served locally
+REFRESH_SECONDS = 15 * 60  # Minimum gap between upstream checks for new bars
+PERIODS = {"1mo": {"months": 1}, "3mo": {"months": 3}, "6mo": {"months": 6}, "1y": {"years": 1}, "2y": {"years": 2}, "5y": {"years": 5}}
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, volume INTEGER,
+    PRIMARY KEY (ticker, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fetches (
+    ticker TEXT PRIMARY KEY,
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exchanges (
+    ticker TEXT PRIMARY KEY,
+    timezone TEXT NOT NULL
+);
+"""
+
+def period_start(period, today=None):
+    """Returns the first date covered by a yfinance-style period ("1mo", "6mo", "1y", "ytd", "5y", ...)."""
+    today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+    if period == "ytd":
+        return today.replace(month=1, day=1)
+    return today - pd.DateOffset(**PERIODS[period])
+
+class PriceStore:
+    """Per-ticker daily bars in SQLite, topped up incrementally from Yahoo Finance.
+
+    The first request for a ticker backfills BACKFILL_PERIOD; after that only bars newer
+    than the last stored date are downloaded (at most every REFRESH_SECONDS), and any
+    range up to five years is sliced from the local table.
+    """
+
+    def __init__(self, path=PRICE_STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:  # Commits on success, rolls back on error
+                yield connection
+        finally:
+            connection.close()
+
+    def _lock_for(self, ticker):
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _bounds(self, connection, ticker):
+        return connection.execute("SELECT MIN(date), MAX(date) FROM bars WHERE ticker = ?", (ticker,)).fetchone()
+
+    def _download(self, ticker, **kwargs):
+        frame = yf.Ticker(ticker).history(auto_adjust=True, actions=True, **kwargs)
+        if frame.empty:
+            return frame
+        index = pd.DatetimeIndex(frame.index)
+        frame.index = index.tz_localize(None).normalize()
+        if index.tz is not None:
+            frame.attrs["timezone"] = str(index.tz)  # Exchange timezone: bars are dated in local time
+        return frame
+
+    def _save(self, connection, ticker, frame):
+        rows = [
+            (ticker, date.strftime("%Y-%m-%d"), row.Open, row.High, row.Low, row.Close, int(row.Volume))
+            for date, row in frame[COLUMNS].dropna(subset=["Close"]).iterrows()
+        ]
+        connection.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def refresh(self, ticker, force=False):
+        """Downloads only the bars missing since the last stored date (or the initial backfill)."""
+        with self._lock_for(ticker), self._connect() as connection:
+            checked = connection.execute("SELECT checked_at FROM fetches WHERE ticker = ?", (ticker,)).fetchone()
+            if not force and checked and time.time() - checked[0] < REFRESH_SECONDS:
+                return
+
+            _, last = self._bounds(connection, ticker)
+            if last is None:
+                frame = self._download(ticker, period=BACKFILL_PERIOD)
+            else:
+                # Re-fetch the last stored bar too: it may have been a partial (intraday) bar
+                frame = self._download(ticker, start=last)
+                new_bars = frame[frame.index > pd.Timestamp(last)]
+                actions = [column for column in ("Stock Splits", "Dividends") if column in new_bars]
+                if actions and (new_bars[actions] > 0).any().any():
+                    # ✅ Splits and dividends re-adjust all earlier prices (auto_adjust), so the stored series must be replaced
+                    frame = self._download(ticker, period=BACKFILL_PERIOD)
+                    if frame.empty:
+                        # yfinance reports failures as an empty frame: keep the old series and retry on the next view
+                        return
+                    connection.execute("DELETE FROM bars WHERE ticker = ?", (ticker,))
+
+            if not frame.empty:
+                self._save(connection, ticker, frame)
+            if frame.attrs.get("timezone"):
+                connection.execute("INSERT OR REPLACE INTO exchanges VALUES (?, ?)", (ticker, frame.attrs["timezone"]))
+            connection.execute("INSERT OR REPLACE INTO fetches VALUES (?, ?)", (ticker, time.time()))
+
+    def timezone(self, ticker):
+        """Returns the exchange timezone recorded for a ticker (e.g. "America/New_York"), or None."""
+        with self._connect() as connection:
+            row = connection.execute("SELECT timezone FROM exchanges WHERE ticker = ?", (ticker,)).fetchone()
+        return row[0] if row else None
+
+    def backfill(self, tickers):
+        """Backfills every ticker that has no stored bars yet with bulk (chunked) downloads."""
+        with self._connect() as connection:
+            missing = [ticker for ticker in dict.fromkeys(tickers) if self._bounds(connection, ticker)[1] is None]
+        if not missing:
+            return
+        panel = download_panel(missing, period=BACKFILL_PERIOD, price_dtype="float64")  # Stored for good: no downcast
+        with self._connect() as connection:
+            for ticker in missing:
+                frame = panel_history(panel, ticker)
+                if frame.empty:
+                    continue  # Left for the per-ticker refresh (and its error reporting)
+                with self._lock_for(ticker):
+                    self._save(connection, ticker, frame)
+                    connection.execute("INSERT OR REPLACE INTO fetches VALUES (?, ?)", (ticker, time.time()))
+
+    def history(self, ticker, period="6mo", refresh=True):
+        """Returns daily OHLCV bars for `period` as a DataFrame indexed by date (like `yf.Ticker.history`).
+
+        If the refresh fails, whatever is already stored is served; the error is only raised
+        when there is nothing stored for the ticker.
+        """
+        if refresh:
+            try:
+                self.refresh(ticker)
+            except Exception:
+                with self._connect() as connection:
+                    if self._bounds(connection, ticker)[1] is None:
+                        raise
+        start = period_start(period)
+        query = "SELECT date, open, high, low, close, volume FROM bars WHERE ticker = ? AND date >= ? ORDER BY date"
+        with self._connect() as connection:
+            rows = connection.execute(query, (ticker, start.strftime("%Y-%m-%d"))).fetchall()
+        frame = pd.DataFrame(rows, columns=["Date", *COLUMNS])
+        frame["Date"] = pd.to_datetime(frame["Date"])
+        return frame.set_index("Date")
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_price_store():
+    """Returns the process-wide price store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PriceStore()
+        return _store
@@ -0,0 +1,53 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from audio_utils import concat_audio, detect_format
+from tts_backends import TTS_MAX_WORKERS, get_registry
+
+# ✅ One pass over the text: each match is a word in a single script
+SCRIPT_WORD = re.compile(r"(?P<devanagari>[ऀ-ॿ꣠-ꣿ]+)|(?P<latin>[A-Za-zÀ-ɏ]+)")
+SCRIPT_LANGUAGES = {"devanagari": "hi", "latin": "en"}
+MIN_LATIN_CHARS = 2  # Single Latin letters (initials, "Q3") stay with the run around them
+
+def split_script_runs(text):
+    """Splits text into (script, run) pairs; spaces, digits and punctuation stay with the run they follow."""
+    runs = []
+    start = 0
+    current = None
+    for match in SCRIPT_WORD.finditer(text):
+        script = match.lastgroup
+        if current is None:
+            current = script
+        elif script != current and (script == "devanagari" or len(match.group()) >= MIN_LATIN_CHARS):
+            runs.append((current, text[start:match.start()]))
+            start, current = match.start(), script
+    if text[start:].strip():
+        runs.append((current, text[start:]))  # Script is None when the text has no letters
+    return [(script, run.strip()) for script, run in runs if run.strip()]
+
+def script_language(text, default_lang="en"):
+    """Returns the language for text written in a single script (e.g. an English company name inside Hindi narration)."""
+    runs = split_script_runs(text)
+    return SCRIPT_LANGUAGES.get(runs[0][0], default_lang) if len(runs) == 1 else default_lang
+
+def synthesize_mixed(text, lang="hi", max_workers=TTS_MAX_WORKERS, registry=None):
+    """Synthesizes mixed Devanagari/Latin text, routing each script run to the language voice suited to it.
+
+    Runs are synthesized concurrently and concatenated in order. They prefer the format of
+    `lang`'s best backend so the clips can be stitched; if a run fails, or an engine fails
+    over to a different format, the whole text is read by `lang`'s engine instead.
+    """
+    registry = registry or get_registry()
+    runs = [(SCRIPT_LANGUAGES.get(script, lang), run) for script, run in split_script_runs(text)]
+    if len(runs) <= 1:
+        return registry.synthesize(text, runs[0][0] if runs else lang)
+
+    fmt = registry.candidates(lang)[0].fmt
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            clips = list(executor.map(lambda run: registry.synthesize(run[1], run[0], fmt=fmt), runs))
+    except Exception:
+        return registry.synthesize(text, lang)  # No format constraint: any engine that still works
+
+    if len({detect_format(clip) for clip in clips}) > 1:
+        return registry.synthesize(text, lang)
+    return concat_audio(clips)
@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from audio_cache import cache_key, get_audio_cache
+from audio_utils import concat_audio
+
+# ✅ Recurring phrases kept in memory; variable segments only in memory while short
+SEGMENT_MEMORY_ITEMS = 1024
+SHORT_SEGMENT_CHARS = 40
+SEGMENT_MAX_WORKERS = 4
+
+class SegmentLibrary:
+    """Reuses synthesized audio for recurring narration phrases.
+
+    Segments are looked up by (text, language, engine, voice, rate, format): first in an
+    in-memory LRU, then in the disk audio cache. Only missing segments are synthesized
+    (concurrently), and the clips are concatenated in order in-process.
+    """
+
+    def __init__(self, max_items=SEGMENT_MEMORY_ITEMS, max_workers=SEGMENT_MAX_WORKERS):
+        self.max_items = max_items
+        self.max_workers = max_workers
+        self._clips = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key, audio):
+        with self._lock:
+            self._clips[key] = audio
+            self._clips.move_to_end(key)
+            while len(self._clips) > self.max_items:
+                self._clips.popitem(last=False)
+
+    def _recall(self, key):
+        with self._lock:
+            audio = self._clips.get(key)
+            if audio is not None:
+                self._clips.move_to_end(key)
+            return audio
+
+    def segment(self, text, fixed, lang, engine, synthesize, voice=None, rate=None, fmt="mp3"):
+        """Returns audio for one segment, synthesizing it with `synthesize(text)` only on a miss."""
+        key = cache_key(text, lang, engine, voice=voice, rate=rate, fmt=fmt)
+        audio = self._recall(key)
+        if audio is None:
+            audio = get_audio_cache().get_or_create(key, lambda: synthesize(text), fmt=fmt)
+            if fixed or len(text) <= SHORT_SEGMENT_CHARS:
+                self._remember(key, audio)
+        return audio
+
+    def render(self, segments, lang, engine, synthesize, voice=None, rate=None, fmt="mp3"):
+        """Renders ordered (text, fixed) segments into one clip."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            clips = executor.map(
+                lambda item: self.segment(item[0], item[1], lang, engine, synthesize, voice, rate, fmt),
+                segments,
+            )
+            return concat_audio(list(clips))
+
+_library = None
+_library_lock = threading.Lock()
+
+def get_segment_library():
+    """Returns the process-wide segment library."""
+    global _library
+    with _library_lock:
+        if _library is None:
+            _library = SegmentLibrary()
+        return _library
@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import yfinance as yf
+from yahoo_fin import stock_info
+from financials import get_financials_service
+from price_store import get_price_store
+from ticker_index import get_ticker_index
+
+# ✅ Per-call time limits (seconds); a call that overruns is reported as an error, not waited on
+TIMEOUTS = {"ticker": 5, "quote": 5, "info": 10, "financials": 20, "history": 15}
+
+# Shared pool: a hung upstream call never blocks the script thread from returning
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="stock-data")
+
+class StockData:
+    """Everything the dashboard shows for one company, plus per-call errors and timings."""
+
+    def __init__(self, company_name, ticker=None):
+        self.company_name = company_name
+        self.ticker = ticker
+        self.price = None
+        self.market_cap = None
+        self.currency = None
+        self.info = None  # Full `.info` dict (only in "full" mode)
+        self.financials = None  # `financials.Statements` (income, balance sheet, cash flow)
+        self.history = None
+        self.errors = {}
+        self.timings = {}
+
+    @property
+    def available(self):
+        return self.ticker is not None and (self.price is not None or self.history is not None)
+
+def resolve_ticker(company_name):
+    """Resolves a company name from the local index, falling back to a live Yahoo lookup."""
+    entry = get_ticker_index().resolve(company_name)
+    if entry:
+        return entry["ticker"]
+    return stock_info.get_quote_table(company_name, dict_result=False).iloc[0]["Symbol"]
+
+def _quote(ticker):
+    fast_info = yf.Ticker(ticker).fast_info
+    return {"price": fast_info.last_price, "market_cap": fast_info.market_cap, "currency": fast_info.currency}
+
+def _timed(function, *args):
+    started = time.monotonic()
+    return function(*args), time.monotonic() - started
+
+def load_stock_data(company_name, mode="full", period="6mo", timeouts=None):
+    """Fetches quote, history and (in "full" mode) `.info` and financials concurrently.
+
+    `mode="quote"` skips the heavy `.info` scrape and the financial statements when only
+    price and market cap are needed. Each call has its own timeout from TIMEOUTS.
+    """
+    timeouts = {**TIMEOUTS, **(timeouts or {})}
+    data = StockData(company_name)
+
+    try:
+        data.ticker, data.timings["ticker"] = _executor.submit(_timed, resolve_ticker, company_name).result(
+            timeout=timeouts["ticker"]
+        )
+    except Exception as e:
+        data.errors["ticker"] = str(e) or type(e).__name__
+        return data
+
+    calls = {
+        "quote": (_quote, data.ticker),
+        "history": (get_price_store().history, data.ticker, period),
+    }
+    if mode == "full":
+        calls["info"] = (lambda ticker: yf.Ticker(ticker).info, data.ticker)
+        calls["financials"] = (get_financials_service().statements, data.ticker)
+
+    started = time.monotonic()
+    futures = {name: _executor.submit(_timed, *call) for name, call in calls.items()}
+    results = {}
+    for name, future in futures.items():
+        # Deadlines run from a common start, since the calls overlap
+        remaining = max(timeouts[name] - (time.monotonic() - started), 0)
+        try:
+            results[name], data.timings[name] = future.result(timeout=remaining)
+        except Exception as e:
+            future.cancel()
+            data.errors[name] = str(e) or f"{type(e).__name__} after {timeouts[name]}s"
+
+    quote = results.get("quote") or {}
+    info = results.get("info") or {}
+    data.price = quote.get("price") or info.get("regularMarketPrice")
+    data.market_cap = quote.get("market_cap") or info.get("marketCap")
+    data.currency = quote.get("currency") or info.get("currency")
+    data.info = results.get("info")
+    data.financials = results.get("financials")
+    data.history = results.get("history")
+    return data
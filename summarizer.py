@@ -0,0 +1,86 @@
+import re
+import numpy as np
+import scipy.sparse as sp
+from topic_analysis import vectorizer
+
+# ✅ Split after ., !, ? or the Devanagari danda, followed by whitespace
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?।])\s+")
+
+def split_sentences(text, min_chars=20):
+    """Splits text into sentences, dropping fragments shorter than `min_chars`."""
+    if not text:
+        return []
+    sentences = (sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text))
+    return [sentence for sentence in sentences if len(sentence) >= min_chars]
+
+def article_sentences(articles):
+    """Collects candidate sentences from article titles, summaries and bodies (deduplicated, in order)."""
+    seen = set()
+    sentences = []
+    for article in articles:
+        parts = [article.get("title") or ""]
+        for field in ("summary", "content"):
+            value = article.get(field) or ""
+            if value != "No summary available.":
+                parts.extend(split_sentences(value))
+        for sentence in parts:
+            key = sentence.lower()
+            if sentence and key not in seen:
+                seen.add(key)
+                sentences.append(sentence)
+    return sentences
+
+def textrank(vectors, damping=0.85, min_similarity=0.1, max_iter=100, tol=1e-6):
+    """Scores sentences by power iteration over a sparse cosine-similarity graph."""
+    n = vectors.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    graph = (vectors @ vectors.T).tocsr()
+    graph.setdiag(0)
+    graph.data[graph.data < min_similarity] = 0
+    graph.eliminate_zeros()
+
+    # ✅ Row-normalize into a transition matrix; sentences with no edges teleport uniformly
+    out_weight = np.asarray(graph.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    out_weight[dangling] = 1
+    transition = (sp.diags(1 / out_weight) @ graph).T.tocsr()
+
+    scores = np.full(n, 1 / n)
+    for _ in range(max_iter):
+        updated = damping * (transition @ scores + scores[dangling].sum() / n) + (1 - damping) / n
+        if np.abs(updated - scores).sum() < tol:
+            return updated
+        scores = updated
+    return scores
+
+def summarize_articles(articles, max_chars=600, redundancy=0.7, **kwargs):
+    """Returns the most salient sentences (highest rank first) that fit within `max_chars`."""
+    sentences = article_sentences(articles)
+    if not sentences:
+        return []
+
+    vectors = vectorizer.transform(sentences)
+    scores = textrank(vectors, **kwargs)
+
+    chosen = []
+    used = 0
+    for index in np.argsort(-scores, kind="stable"):
+        sentence = sentences[index]
+        if used + len(sentence) > max_chars:
+            continue
+        # ✅ Skip near-duplicates of sentences already picked (same story, different outlet)
+        if chosen and (vectors[chosen] @ vectors[index].T).max() >= redundancy:
+            continue
+        chosen.append(index)
+        used += len(sentence) + 1
+    return [sentences[index] for index in chosen]
+
+def summarize_companies(articles_by_company, max_chars=600, **kwargs):
+    """Summarizes each company's articles independently: {company: [sentences]}."""
+    return {
+        company: summarize_articles(articles, max_chars=max_chars, **kwargs)
+        for company, articles in articles_by_company.items()
+        if isinstance(articles, list)
+    }
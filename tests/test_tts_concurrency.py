@@ -0,0 +1,84 @@
+import io
+import os
+import sys
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("nltk")
+pytest.importorskip("gtts")
+
+import audio_cache
+import news_sentiment
+import script_router
+import tts_converter
+import tts_output
+from script_router import SCRIPT_LANGUAGES, split_script_runs
+from tts_backends import BackendRegistry, TTSBackend
+
+JOBS = 64
+
+def stub_wav(text):
+    """A WAV clip whose frames are the text itself, so every output can be checked exactly."""
+    frames = text.encode("utf-8")
+    output = io.BytesIO()
+    with wave.open(output, "wb") as clip:
+        clip.setnchannels(1)
+        clip.setsampwidth(2)
+        clip.setframerate(16000)
+        clip.writeframes(frames + b"\0" * (len(frames) % 2))
+    return output.getvalue()
+
+def wav_frames(audio):
+    with wave.open(io.BytesIO(audio), "rb") as clip:
+        return clip.readframes(clip.getnframes())
+
+def expected_frames(text):
+    """What the stub produces for `text`: one clip per script run, stitched in order."""
+    return b"".join(wav_frames(stub_wav(run)) for _, run in split_script_runs(text))
+
+class StubBackend(TTSBackend):
+    name = "stub"
+    fmt = "wav"
+    local = True
+    languages = ("en", "hi")
+
+    def synthesize(self, text, lang):
+        return stub_wav(text)
+
+@pytest.fixture
+def stub_tts(tmp_path, monkeypatch):
+    registry = BackendRegistry()
+    registry.register(StubBackend(), preferred_for=SCRIPT_LANGUAGES.values())
+    monkeypatch.setattr(script_router, "get_registry", lambda: registry)
+    monkeypatch.setattr(audio_cache, "_cache", audio_cache.AudioCache(root=str(tmp_path / "cache")))
+    monkeypatch.setattr(tts_output, "TTS_OUTPUT_DIR", str(tmp_path / "output"))
+    return registry
+
+def job_text(i):
+    # Every job mixes scripts, so each one goes through per-run routing and stitching
+    return f"Tesla के शेयर आज {i} प्रतिशत गिरे। Job {i} finished."
+
+def run_jobs(convert):
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return list(executor.map(convert, range(JOBS)))
+
+def assert_outputs(paths):
+    assert len(set(paths)) == JOBS, "output paths collided"
+    for i, path in enumerate(paths):
+        with open(path, "rb") as audio_file:
+            assert wav_frames(audio_file.read()) == expected_frames(job_text(i)), f"{path} has the wrong audio"
+
+def test_news_sentiment_text_to_speech_concurrent(stub_tts):
+    paths = run_jobs(lambda i: news_sentiment.text_to_speech(job_text(i), lang="hi", fmt="wav"))
+    assert all(os.path.isfile(path) for path in paths), paths[:3]
+    assert_outputs(paths)
+
+def test_tts_converter_text_to_speech_concurrent(stub_tts):
+    prefix = "Speech saved successfully as "
+    results = run_jobs(lambda i: tts_converter.text_to_speech(job_text(i), lang="hi", fmt="wav"))
+    assert all(result.startswith(prefix) for result in results), results[:3]
+    assert_outputs([result[len(prefix):] for result in results])
@@ -0,0 +1,175 @@
+import csv
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+import requests
+
+SYMBOLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "symbols.csv")
+NASDAQ_LISTINGS = {
+    "NASDAQ": "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt",
+    "OTHER": "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+}
+OTHER_EXCHANGES = {"N": "NYSE", "A": "NYSE American", "P": "NYSE Arca", "Z": "Cboe BZX", "V": "IEX"}
+
+# ✅ Corporate suffixes that users never type ("Apple" should match "Apple Inc.")
+SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited", "plc",
+    "group", "holding", "holdings", "sa", "ag", "nv", "the", "class", "common", "stock", "shares",
+}
+COMPLETIONS_PER_NODE = 8
+RESOLVE_MIN_SCORE = 0.85  # Fuzzy matches below this are left to the live lookup
+RESOLVE_MIN_CHARS = 4  # Shorter queries must match a name, alias or ticker exactly
+
+def normalize(name):
+    """Lowercases, drops punctuation and corporate suffixes: "The Walt Disney Company" -> "walt disney"."""
+    words = re.sub(r"[^a-z0-9& ]+", " ", name.lower().replace(".com", "")).split()
+    kept = [word for word in words if word not in SUFFIXES]
+    return " ".join(kept or words)
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def load_symbol_table(path=SYMBOLS_PATH):
+    """Reads the symbol table CSV (ticker, name, exchange, "|"-separated aliases) into a list of dicts."""
+    with open(path, encoding="utf-8", newline="") as symbols_file:
+        return [
+            {
+                "ticker": row["ticker"].strip(),
+                "name": row["name"].strip(),
+                "exchange": row.get("exchange", "").strip(),
+                "aliases": [alias.strip() for alias in (row.get("aliases") or "").split("|") if alias.strip()],
+            }
+            for row in csv.DictReader(symbols_file)
+            if row.get("ticker") and row.get("name")
+        ]
+
+def download_us_listings(path=SYMBOLS_PATH):
+    """Merges every NASDAQ/NYSE-listed symbol from NASDAQ Trader's symbol directory into the symbol table."""
+    entries = {entry["ticker"]: entry for entry in load_symbol_table(path)} if os.path.exists(path) else {}
+    for source, url in NASDAQ_LISTINGS.items():
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        rows = csv.DictReader(response.text.splitlines(), delimiter="|")
+        for row in rows:
+            ticker = row.get("Symbol") or row.get("ACT Symbol")
+            if not ticker or row.get("Test Issue") == "Y" or ticker.startswith("File Creation Time"):
+                continue
+            ticker = ticker.replace(".", "-")  # Yahoo uses BRK-B rather than BRK.B
+            exchange = "NASDAQ" if source == "NASDAQ" else OTHER_EXCHANGES.get(row.get("Exchange"), "US")
+            name = (row.get("Security Name") or "").split(" - ")[0].strip()
+            entries.setdefault(ticker, {"ticker": ticker, "name": name, "exchange": exchange, "aliases": []})
+
+    with open(path, "w", encoding="utf-8", newline="") as symbols_file:
+        writer = csv.writer(symbols_file)
+        writer.writerow(["ticker", "name", "exchange", "aliases"])
+        for entry in entries.values():
+            writer.writerow([entry["ticker"], entry["name"], entry["exchange"], "|".join(entry["aliases"])])
+    return len(entries)
+
+def short_name(entry):
+    """Name people search news for: the first alias ("Tesla") rather than the legal name ("Tesla Inc.")."""
+    return entry["aliases"][0] if entry["aliases"] else entry["name"]
+
+class TrieNode:
+    __slots__ = ("children", "completions")
+
+    def __init__(self):
+        self.children = {}
+        self.completions = []  # Best entry ids for this prefix, at most COMPLETIONS_PER_NODE
+
+class TickerIndex:
+    """In-memory company-name -> ticker resolver.
+
+    Exact names, aliases and tickers resolve through a dict; a prefix trie (each node keeps
+    its best few completions) powers autocomplete; a trigram index plus `SequenceMatcher`
+    re-scoring handles typos. Entries earlier in the symbol table rank first.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self._exact = {}
+        self._root = TrieNode()
+        self._trigrams = defaultdict(set)
+
+        for entry_id, entry in enumerate(entries):
+            self._exact.setdefault(entry["ticker"].lower(), entry_id)
+            for key in {normalize(label) for label in [entry["name"], *entry["aliases"]]}:
+                self._exact.setdefault(key, entry_id)
+                self._insert(key, entry_id)
+                for gram in trigrams(key):
+                    self._trigrams[gram].add(entry_id)
+            self._insert(entry["ticker"].lower(), entry_id)
+
+    def _insert(self, key, entry_id):
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, TrieNode())
+            if entry_id not in node.completions and len(node.completions) < COMPLETIONS_PER_NODE:
+                node.completions.append(entry_id)
+
+    def complete(self, prefix, limit=COMPLETIONS_PER_NODE):
+        """Returns up to `limit` entries whose name, alias or ticker starts with `prefix`."""
+        key = normalize(prefix) if prefix.strip() else ""
+        if not key:
+            return []
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [self.entries[entry_id] for entry_id in node.completions[:limit]]
+
+    def search(self, query, limit=5, min_score=0.6):
+        """Fuzzy search: candidates sharing the most trigrams, re-scored by similarity ratio."""
+        key = normalize(query)
+        if not key:
+            return []
+        shared = Counter()
+        for gram in trigrams(key):
+            shared.update(self._trigrams.get(gram, ()))
+
+        scored = []
+        for entry_id, _ in shared.most_common(limit * 4):
+            entry = self.entries[entry_id]
+            score = max(
+                SequenceMatcher(None, key, normalize(label)).ratio()
+                for label in [entry["name"], *entry["aliases"], entry["ticker"]]
+            )
+            if score >= min_score:
+                scored.append((score, -entry_id))
+        scored.sort(reverse=True)
+        return [self.entries[-negated_id] for _, negated_id in scored[:limit]]
+
+    def resolve(self, query):
+        """Returns the entry for a company name, alias or ticker, or None when unsure.
+
+        Only exact matches and close typos count; prefixes are left to `complete` (the
+        autocomplete), since "Micro" or "General" would otherwise silently pick a company.
+        """
+        key = normalize(query)
+        if not key:
+            return None
+        entry_id = self._exact.get(key, self._exact.get(query.strip().lower()))
+        if entry_id is not None:
+            return self.entries[entry_id]
+        if len(key) < RESOLVE_MIN_CHARS:
+            return None
+        matches = self.search(query, limit=1, min_score=RESOLVE_MIN_SCORE)
+        return matches[0] if matches else None
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_ticker_index():
+    """Returns the process-wide index, loaded from SYMBOLS_PATH on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TickerIndex(load_symbol_table())
+        return _index
+
+if __name__ == "__main__":
+    print(f"✅ Symbol table now has {download_us_listings()} entries")
@@ -0,0 +1,215 @@
+import heapq
+from collections import Counter, deque
+import numpy as np
+import scipy.sparse as sp
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import HashingVectorizer
+
+# ✅ Stateless vectorizer: no vocabulary to fit, so batches and streams share one feature space
+vectorizer = HashingVectorizer(
+    n_features=2**16,
+    stop_words="english",
+    alternate_sign=False,
+    norm="l2",
+)
+
+def article_text(article):
+    """Returns the text used to represent an article topically (title + summary)."""
+    summary = article.get("summary") or ""
+    if summary == "No summary available.":
+        summary = ""
+    return f"{article.get('title') or ''}. {summary}"
+
+def vectorize_articles(articles):
+    """Returns an L2-normalized sparse (CSR) matrix with one row per article."""
+    return vectorizer.transform([article_text(article) for article in articles])
+
+def top_similar_pairs(left, right, top_k=5, min_similarity=0.2):
+    """Finds the `top_k` most similar (row in left, row in right) pairs above `min_similarity`.
+
+    Uses a single sparse matrix product; returns a list of (i, j, similarity) sorted by similarity.
+    """
+    if left.shape[0] == 0 or right.shape[0] == 0 or top_k <= 0:
+        return []
+
+    similarity = (left @ right.T).tocoo()
+    keep = similarity.data >= min_similarity
+    rows, cols, scores = similarity.row[keep], similarity.col[keep], similarity.data[keep]
+
+    if len(scores) > top_k:
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        rows, cols, scores = rows[best], cols[best], scores[best]
+
+    order = np.argsort(-scores, kind="stable")
+    return [(int(rows[k]), int(cols[k]), float(scores[k])) for k in order]
+
+def _contrast_entry(positive_title, negative_title, score):
+    return {
+        "Comparison": f"Article '{positive_title}' vs. Article '{negative_title}'",
+        "Impact": "Both cover the same story, but one is Positive while the other is Negative.",
+        "Similarity": round(score, 3),
+    }
+
+def find_contrasting_pairs(news_list, top_k=5, min_similarity=0.2):
+    """Finds the most topically similar article pairs with opposite (Positive vs. Negative) sentiment."""
+    labels = np.array([article["sentiment"] for article in news_list])
+    positive = np.flatnonzero(labels == "Positive")
+    negative = np.flatnonzero(labels == "Negative")
+    if len(positive) == 0 or len(negative) == 0:
+        return []
+
+    vectors = vectorize_articles(news_list)
+    pairs = top_similar_pairs(vectors[positive], vectors[negative], top_k, min_similarity)
+
+    return [
+        _contrast_entry(news_list[positive[i]]["title"], news_list[negative[j]]["title"], score)
+        for i, j, score in pairs
+    ]
+
+class ContrastTracker:
+    """Keeps the top-k contrasting (Positive vs. Negative) pairs over a stream of articles.
+
+    New articles are compared against a bounded window of recent articles of the opposite
+    sentiment, so memory stays flat no matter how many articles flow through.
+    """
+
+    def __init__(self, top_k=5, min_similarity=0.2, window=500):
+        self.top_k = top_k
+        self.min_similarity = min_similarity
+        self._windows = {"Positive": deque(maxlen=window), "Negative": deque(maxlen=window)}
+        self._best = []  # Min-heap of (similarity, positive title, negative title)
+
+    def update(self, articles):
+        """Scores a batch of articles against each other and against the recent window."""
+        articles = [article for article in articles if article.get("sentiment") in self._windows]
+        if not articles:
+            return self
+
+        vectors = vectorize_articles(articles)
+        batch = {"Positive": [], "Negative": []}
+        for row, article in enumerate(articles):
+            batch[article["sentiment"]].append((vectors[row], article["title"]))
+
+        # ✅ New positives vs. (window + new) negatives, then new negatives vs. window positives
+        self._score(batch["Positive"], list(self._windows["Negative"]) + batch["Negative"], flipped=False)
+        self._score(batch["Negative"], list(self._windows["Positive"]), flipped=True)
+
+        for label, entries in batch.items():
+            self._windows[label].extend(entries)
+        return self
+
+    def _score(self, left, right, flipped):
+        if not left or not right:
+            return
+        pairs = top_similar_pairs(
+            sp.vstack([vector for vector, _ in left]),
+            sp.vstack([vector for vector, _ in right]),
+            self.top_k,
+            self.min_similarity,
+        )
+        seen = {(positive, negative) for _, positive, negative in self._best}
+        for i, j, score in pairs:
+            positive, negative = (right[j][1], left[i][1]) if flipped else (left[i][1], right[j][1])
+            if (positive, negative) in seen:
+                continue
+            seen.add((positive, negative))
+            if len(self._best) < self.top_k:
+                heapq.heappush(self._best, (score, positive, negative))
+            else:
+                heapq.heappushpop(self._best, (score, positive, negative))
+
+    def report(self):
+        """Returns the current top-k pairs in the same shape as `find_contrasting_pairs`."""
+        return [_contrast_entry(positive, negative, score) for score, positive, negative in sorted(self._best, reverse=True)]
+
+class TopicClusterer:
+    """Groups articles into stories with mini-batch k-means over hashed article vectors.
+
+    Each call to `partial_fit` nudges the existing centroids instead of refitting, so the
+    clusterer can absorb tens of thousands of articles batch by batch. Per-cluster counts
+    and headlines reflect the assignment made when an article arrived.
+    """
+
+    def __init__(self, n_clusters=8, max_headlines=3, batch_size=256, random_state=0):
+        self.n_clusters = n_clusters
+        self.max_headlines = max_headlines
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.model = None
+        self._pending = []  # Articles held back until there are enough to seed the centroids
+        self._sizes = Counter()
+        self._sentiments = {}
+        self._headlines = {}
+
+    def partial_fit(self, articles):
+        """Updates the clusters with a batch of articles."""
+        articles = [article for article in articles if article.get("title")]
+        if self.model is None:
+            self._pending.extend(articles)
+            if len(self._pending) < self.n_clusters:
+                return self
+            articles, self._pending = self._pending, []
+            self._start(self.n_clusters)
+
+        if articles:
+            self._update(articles)
+        return self
+
+    def flush(self):
+        """Clusters any held-back articles, shrinking k if fewer than `n_clusters` ever arrived."""
+        if self.model is None and self._pending:
+            articles, self._pending = self._pending, []
+            self._start(min(self.n_clusters, len(articles)))
+            self._update(articles)
+        return self
+
+    def _start(self, n_clusters):
+        self.model = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            batch_size=self.batch_size,
+            n_init=1,
+            random_state=self.random_state,
+        )
+
+    def _update(self, articles):
+        vectors = vectorize_articles(articles)
+        self.model.partial_fit(vectors)
+        distances = self.model.transform(vectors)
+        labels = distances.argmin(axis=1)
+        closeness = -distances[np.arange(len(labels)), labels]
+
+        for article, label, score in zip(articles, labels.tolist(), closeness.tolist()):
+            self._sizes[label] += 1
+            self._sentiments.setdefault(label, Counter())[article.get("sentiment", "Neutral")] += 1
+
+            # ✅ Bounded min-heap keeps only the headlines closest to the centroid
+            headlines = self._headlines.setdefault(label, [])
+            if any(title == article["title"] for _, title in headlines):
+                continue
+            if len(headlines) < self.max_headlines:
+                heapq.heappush(headlines, (score, article["title"]))
+            else:
+                heapq.heappushpop(headlines, (score, article["title"]))
+
+    def report(self, flush=True):
+        """Returns one entry per story, largest first, with its sentiment mix and representative headlines.
+
+        With `flush=False` held-back articles stay pending, so an intermediate report does not fix k too early.
+        """
+        if flush:
+            self.flush()
+        return [
+            {
+                "Topic": max(self._headlines[label])[1],
+                "Articles": size,
+                "Sentiment Distribution": dict(self._sentiments[label]),
+                "Headlines": [title for _, title in sorted(self._headlines[label], reverse=True)],
+            }
+            for label, size in self._sizes.most_common()
+        ]
+
+def cluster_topics(news_list, max_clusters=8, max_headlines=3):
+    """Groups a batch of articles into stories (roughly one story per 2-3 articles, capped at `max_clusters`)."""
+    n_clusters = max(1, min(max_clusters, len(news_list) // 3))
+    clusterer = TopicClusterer(n_clusters=n_clusters, max_headlines=max_headlines)
+    return clusterer.partial_fit(news_list).report()
@@ -0,0 +1,251 @@
+import re
+import threading
+from abc import ABC, abstractmethod
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from gtts import gTTS
+from audio_cache import cache_key, get_audio_cache
+from audio_utils import concat_audio
+from tts_worker import get_worker_pool
+
+# ✅ Chunking and parallelism for long texts
+MAX_CHUNK_CHARS = 200
+FIRST_CHUNK_CHARS = 80  # Short first chunk so playback can start quickly
+TTS_MAX_WORKERS = 4
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?।])\s+")
+
+# ✅ Health and latency policy for remote engines
+SLOW_BACKEND_SECONDS = 8.0  # A remote call slower than this counts as a failure
+FAILURE_COOLDOWN_SECONDS = 30.0  # Doubled per consecutive failure, capped at MAX_COOLDOWN_SECONDS
+MAX_COOLDOWN_SECONDS = 300.0
+LATENCY_SMOOTHING = 0.3  # Weight of the newest sample in the latency moving average
+
+def synthesize_gtts(text, lang="hi", slow=False):
+    """Synthesizes text with gTTS and returns the MP3 bytes."""
+    buffer = BytesIO()
+    gTTS(text=text, lang=lang, slow=slow).write_to_fp(buffer)
+    return buffer.getvalue()
+
+def split_chunks(text, max_chars=MAX_CHUNK_CHARS, first_chars=FIRST_CHUNK_CHARS):
+    """Splits text at sentence boundaries into chunks of at most `max_chars` (the first at most `first_chars`)."""
+    chunks = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        limit = first_chars if not chunks else max_chars
+        # Sentences longer than the limit are broken at word boundaries
+        while len(sentence) > limit:
+            cut = sentence.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+            limit = max_chars
+        if current and len(current) + 1 + len(sentence) > limit:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk]
+
+class TTSBackend(ABC):
+    """A speech engine that turns one piece of text into audio bytes."""
+
+    name = None
+    fmt = "mp3"
+    local = False  # Local engines need no network and are never timed out
+    languages = ()
+    voice = None
+    rate = None
+
+    def supports(self, lang):
+        return lang in self.languages
+
+    def cache_key(self, text, lang):
+        return cache_key(text, lang, self.name, voice=self.voice, rate=self.rate, fmt=self.fmt)
+
+    @abstractmethod
+    def synthesize(self, text, lang):
+        """Returns `text` spoken in `lang` as audio bytes in `fmt`."""
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS (online, natural Hindi and English voices)."""
+
+    name = "gtts"
+    languages = ("en", "hi")
+    rate = "normal"
+
+    def synthesize(self, text, lang):
+        return synthesize_gtts(text, lang=lang)
+
+class Pyttsx3Backend(TTSBackend):
+    """pyttsx3 on the persistent worker pool (offline; Hindi through espeak-ng's voice)."""
+
+    name = "pyttsx3"
+    fmt = "wav"
+    local = True
+    languages = ("en", "hi")
+    rate = 180
+
+    def synthesize(self, text, lang):
+        return get_worker_pool().synthesize(text, rate=self.rate, lang=lang)
+
+def stream_chunks(backend, text, lang, max_workers=TTS_MAX_WORKERS):
+    """Yields one backend's audio chunk by chunk, in order, as soon as each chunk is ready.
+
+    Chunks are synthesized concurrently (at most `max_workers` at a time) and cached individually.
+    """
+    chunks = split_chunks(text)
+    cache = get_audio_cache()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(
+                cache.get_or_create, backend.cache_key(chunk, lang), lambda chunk=chunk: backend.synthesize(chunk, lang), backend.fmt
+            )
+            for chunk in chunks
+        ]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+class BackendStats:
+    """Moving-average latency and failure state for one backend."""
+
+    def __init__(self):
+        self.latency = None
+        self.failures = 0
+        self.unhealthy_until = 0.0
+
+    def healthy(self, now):
+        return now >= self.unhealthy_until
+
+class BackendRegistry:
+    """Picks a TTS backend per language by preference, measured latency and health, failing over on errors.
+
+    Candidates for a language are ordered: healthy before cooling-down, fast before slow
+    (moving-average latency above `slow_seconds`), preferred before the rest, then by latency.
+    """
+
+    def __init__(self, slow_seconds=SLOW_BACKEND_SECONDS):
+        self.slow_seconds = slow_seconds
+        self._backends = []
+        self._preferred = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._timer = ThreadPoolExecutor(max_workers=32, thread_name_prefix="tts-backend")
+
+    def register(self, backend, preferred_for=()):
+        self._backends.append(backend)
+        self._preferred[backend.name] = set(preferred_for)
+        self._stats[backend.name] = BackendStats()
+        return backend
+
+    def candidates(self, lang, fmt=None):
+        """Returns the backends supporting `lang`, best first (cooling-down ones last, as a last resort).
+
+        With `fmt`, healthy backends producing that format rank first; the others are still
+        returned, so a format preference never removes the fallback engine.
+        """
+        now = time.monotonic()
+        with self._lock:
+            def rank(backend):
+                stats = self._stats[backend.name]
+                latency = stats.latency if stats.latency is not None else 0.0
+                return (
+                    not stats.healthy(now),
+                    fmt is not None and backend.fmt != fmt,
+                    latency > self.slow_seconds,
+                    lang not in self._preferred[backend.name],
+                    latency,
+                )
+
+            return sorted([backend for backend in self._backends if backend.supports(lang)], key=rank)
+
+    def record_success(self, backend, elapsed=None):
+        """Marks a backend healthy and folds `elapsed` (seconds for a whole request) into its latency."""
+        with self._lock:
+            stats = self._stats[backend.name]
+            if elapsed is not None:
+                stats.latency = elapsed if stats.latency is None else (
+                    LATENCY_SMOOTHING * elapsed + (1 - LATENCY_SMOOTHING) * stats.latency
+                )
+            stats.failures = 0
+            stats.unhealthy_until = 0.0
+
+    def record_failure(self, backend):
+        with self._lock:
+            stats = self._stats[backend.name]
+            stats.failures += 1
+            cooldown = min(FAILURE_COOLDOWN_SECONDS * 2 ** (stats.failures - 1), MAX_COOLDOWN_SECONDS)
+            stats.unhealthy_until = time.monotonic() + cooldown
+
+    def run(self, lang, job, fmt=None):
+        """Runs `job(backend)` on the best backend for `lang`, failing over until one succeeds."""
+        last_error = None
+        for backend in self.candidates(lang, fmt):
+            started = time.monotonic()
+            try:
+                if backend.local:
+                    audio = job(backend)
+                else:
+                    # ✅ A remote engine that is too slow is abandoned in favour of the next one
+                    audio = self._timer.submit(job, backend).result(timeout=self.slow_seconds)
+            except Exception as e:
+                self.record_failure(backend)
+                last_error = e
+                continue
+            self.record_success(backend, time.monotonic() - started)
+            return audio
+        raise RuntimeError(f"No TTS backend could synthesize '{lang}' speech: {last_error}")
+
+    def synthesize(self, text, lang, max_workers=TTS_MAX_WORKERS, fmt=None):
+        """Returns audio for `text`, reusing any backend's cached result before synthesizing."""
+        cache = get_audio_cache()
+        for backend in self.candidates(lang, fmt):
+            audio = cache.get(backend.cache_key(text, lang), backend.fmt)
+            if audio is not None:
+                return audio
+
+        def job(backend):
+            audio = concat_audio(list(stream_chunks(backend, text, lang, max_workers)))
+            cache.put(backend.cache_key(text, lang), audio, backend.fmt)
+            return audio
+
+        return self.run(lang, job, fmt)
+
+    def stream(self, text, lang, max_workers=TTS_MAX_WORKERS):
+        """Yields audio chunks as they become ready, failing over if a backend breaks before its first chunk."""
+        last_error = None
+        for backend in self.candidates(lang):
+            chunks = stream_chunks(backend, text, lang, max_workers)
+            try:
+                first = next(chunks, None)
+            except Exception as e:
+                self.record_failure(backend)
+                last_error = e
+                continue
+            self.record_success(backend)  # Time to first chunk is not comparable with whole-request latency
+            if first is not None:
+                yield first
+                yield from chunks
+            return
+        raise RuntimeError(f"No TTS backend could synthesize '{lang}' speech: {last_error}")
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_registry():
+    """Returns the process-wide registry: gTTS preferred for Hindi, pyttsx3 for English, each the other's fallback."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = BackendRegistry()
+            _registry.register(GTTSBackend(), preferred_for=("hi",))
+            _registry.register(Pyttsx3Backend(), preferred_for=("en",))
+        return _registry
@@ -1,15 +1,30 @@
-from gtts import gTTS
 import os
+from audio_utils import DEFAULT_FORMAT, detect_format, transcode, transcode_stream
+from tts_backends import TTS_MAX_WORKERS, get_registry, split_chunks, synthesize_gtts
+from script_router import synthesize_mixed
+from tts_output import write_output
 
-def text_to_speech(text, filename="output.mp3", lang="hi"):
-    """Converts text to Hindi speech and saves as an MP3 file."""
+def stream_speech(text, lang="hi", max_workers=TTS_MAX_WORKERS, fmt=None, bitrate_kbps=None):
+    """Yields speech audio chunk by chunk, in order, so playback can start with the first sentence.
+
+    With `fmt`, chunks are transcoded on the fly (see `audio_utils.transcode_stream`).
+    """
+    chunks = get_registry().stream(text, lang, max_workers=max_workers)
+    return transcode_stream(chunks, fmt, bitrate_kbps) if fmt else chunks
+
+def text_to_speech(text, filename=None, lang="hi", fmt=DEFAULT_FORMAT, bitrate_kbps=None):
+    """Converts text to Hindi speech and saves it as `fmt` (MP3 by default; a unique per-job file unless `filename` is given)."""
     try:
         if not text:
             return "Error: No text provided for speech conversion."
         
-        # Convert text to speech
-        tts = gTTS(text=text, lang=lang, slow=False)
-        tts.save(filename)
+        # Convert text to speech (cached; Hindi/English runs routed per script, gTTS with offline fallback)
+        audio = transcode(synthesize_mixed(text, lang), fmt, bitrate_kbps)
+        if filename is None:
+            filename = write_output(audio, lang, ext=detect_format(audio))
+        else:
+            with open(filename, "wb") as audio_file:
+                audio_file.write(audio)
 
         return f"Speech saved successfully as {filename}"
     
@@ -19,5 +34,5 @@ def text_to_speech(text, filename="output.mp3", lang="hi"):
 # Test the function
 if __name__ == "__main__":
     sample_text = "गूगल एक बहुत बड़ी टेक्नोलॉजी कंपनी है।"
-    print(text_to_speech(sample_text))
+    print(text_to_speech(sample_text, filename="output.mp3"))
     os.system("start output.mp3")  # Play the audio file (Windows)
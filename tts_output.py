@@ -0,0 +1,70 @@
+import atexit
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+# ✅ Managed area for per-job audio files (override via environment)
+TTS_OUTPUT_DIR = os.environ.get("TTS_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "news_tts_output"))
+TTS_OUTPUT_MAX_AGE = int(os.environ.get("TTS_OUTPUT_MAX_AGE", "3600"))  # Seconds before a file is swept
+CLEANUP_INTERVAL = 60
+
+_created = set()
+_lock = threading.Lock()
+_last_cleanup = 0.0
+
+def new_output_path(lang, ext="mp3"):
+    """Returns a fresh, collision-free path for one synthesis job's output."""
+    os.makedirs(TTS_OUTPUT_DIR, exist_ok=True)
+    _maybe_cleanup()
+    path = os.path.join(TTS_OUTPUT_DIR, f"speech_{lang}_{uuid.uuid4().hex}.{ext}")
+    with _lock:
+        _created.add(path)
+    return path
+
+def write_output(audio, lang, ext="mp3"):
+    """Writes audio bytes to a new per-job file and returns its path."""
+    path = new_output_path(lang, ext)
+    with open(path, "wb") as audio_file:
+        audio_file.write(audio)
+    return path
+
+def cleanup_outputs(max_age=TTS_OUTPUT_MAX_AGE):
+    """Deletes output files older than `max_age` seconds; returns how many were removed."""
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        names = os.listdir(TTS_OUTPUT_DIR)
+    except OSError:
+        return 0
+    for name in names:
+        path = os.path.join(TTS_OUTPUT_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass  # Already removed by another process
+    return removed
+
+def _maybe_cleanup():
+    global _last_cleanup
+    now = time.time()
+    with _lock:
+        if now - _last_cleanup < CLEANUP_INTERVAL:
+            return
+        _last_cleanup = now
+    cleanup_outputs()
+
+@atexit.register
+def _remove_own_outputs():
+    """Removes every file this process created when it exits."""
+    with _lock:
+        paths = list(_created)
+        _created.clear()
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
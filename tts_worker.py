@@ -0,0 +1,109 @@
+import atexit
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# ✅ Number of worker processes, each owning one long-lived pyttsx3 engine
+TTS_POOL_SIZE = int(os.environ.get("TTS_POOL_SIZE", "2"))
+DEFAULT_RATE = 180
+
+# Engine owned by the current worker process (set by `_init_engine`)
+_engine = None
+_defaults = {}
+_voices_by_lang = {}
+
+def _init_engine(rate):
+    """Runs once per worker process: pays the pyttsx3 driver startup cost a single time."""
+    global _engine
+    import pyttsx3
+
+    _engine = pyttsx3.init()
+    _engine.setProperty("rate", rate)
+    _defaults.update(voice=_engine.getProperty("voice"), rate=rate)
+
+def _voice_for(lang):
+    """Finds an installed voice for `lang` (e.g. espeak-ng's Hindi voice), or None to keep the default."""
+    if lang not in _voices_by_lang:
+        match = None
+        for voice in _engine.getProperty("voices"):
+            languages = [
+                code.decode(errors="ignore").lstrip("\x05") if isinstance(code, bytes) else str(code)
+                for code in (voice.languages or [])
+            ]
+            if any(code.split("-")[0].split("_")[0] == lang for code in languages) or voice.id.split("/")[-1] == lang:
+                match = voice.id
+                break
+        _voices_by_lang[lang] = match
+    return _voices_by_lang[lang]
+
+def _synthesize(text, voice=None, rate=None, lang=None):
+    """Synthesizes `text` with the worker's engine and returns the audio bytes (WAV)."""
+    # ✅ Settings are per job: the engine is shared by every job this worker runs
+    if voice is None and lang is not None:
+        voice = _voice_for(lang)
+    _engine.setProperty("voice", voice or _defaults["voice"])
+    _engine.setProperty("rate", rate or _defaults["rate"])
+
+    fd, path = tempfile.mkstemp(suffix=".wav")
+    os.close(fd)
+    try:
+        _engine.save_to_file(text, path)
+        _engine.runAndWait()
+        with open(path, "rb") as audio_file:
+            return audio_file.read()
+    finally:
+        os.remove(path)
+
+class TTSWorkerPool:
+    """Pool of worker processes that keep a pyttsx3 engine alive between jobs.
+
+    Jobs travel to the workers over the executor's call queue, so synthesis never runs
+    on (or blocks the driver loop of) the caller's thread.
+    """
+
+    def __init__(self, size=TTS_POOL_SIZE, rate=DEFAULT_RATE):
+        self.size = size
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._executor = self._start()
+
+    def _start(self):
+        return ProcessPoolExecutor(
+            max_workers=self.size,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_engine,
+            initargs=(self.rate,),
+        )
+
+    def submit(self, text, voice=None, rate=None, lang=None):
+        """Queues a synthesis job and returns a Future resolving to the audio bytes."""
+        with self._lock:
+            try:
+                return self._executor.submit(_synthesize, text, voice, rate, lang)
+            except BrokenProcessPool:
+                # ✅ A crashed driver takes its worker down; start a fresh pool
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._start()
+                return self._executor.submit(_synthesize, text, voice, rate, lang)
+
+    def synthesize(self, text, voice=None, rate=None, lang=None, timeout=None):
+        """Blocks until the job finishes and returns the audio bytes."""
+        return self.submit(text, voice, rate, lang).result(timeout=timeout)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_worker_pool(size=TTS_POOL_SIZE):
+    """Returns the process-wide worker pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = TTSWorkerPool(size=size)
+            atexit.register(_pool.shutdown)
+        return _pool